@@ -0,0 +1,319 @@
+"""
+📈 Almacén materializado de KPIs y agregados por categoría.
+
+Para cada dimensión (tipo de construcción, material, clima y el total) guarda el
+número de proyectos, sumas, sumas de cuadrados, mínimo y máximo de cada métrica,
+más un boceto de cuantiles acotado (como mucho ``CENTROIDES`` centroides por
+métrica y grupo), de forma que medias, desviaciones, extremos y cuantiles se leen
+en O(categorías) sin recorrer el DataFrame y la memoria no crece con las filas.
+Los cuantiles son exactos mientras un grupo no supera ``CENTROIDES`` valores y,
+a partir de ahí, aproximados con un error de rango de ~1/``CENTROIDES``.
+
+Los agregados se calculan una vez por versión del dataset. Si una versión nueva
+tiene más filas que la anterior y las últimas filas ya incorporadas siguen
+iguales (huella de la cola), se actualizan con las filas nuevas en lugar de
+recalcularse desde cero.
+
+La memoria de cada almacén cuenta en el presupuesto de ``datos`` y se libera
+junto con el DataFrame del que procede.
+"""
+import hashlib
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import datos
+from prediccion import COLUMNAS_CATEGORICAS
+
+TOTAL = "Total"
+DIMENSIONES = [TOTAL] + COLUMNAS_CATEGORICAS
+METRICAS = ["Costo Total (€)", "Duración (meses)", "Eficiencia (%)", "Satisfacción Cliente (1-5)",
+            "Riesgo de Retraso (%)", "Rentabilidad (%)"]
+CENTROIDES = int(os.environ.get("CFC_CENTROIDES_AGREGADOS", 256))
+FILAS_COLA = 64  # filas finales cuya huella identifica lo ya incorporado
+
+
+# (etiqueta, métrica, formato) de los KPIs de "Presentación y Datos" y de los informes
+KPIS = [
+    ("Costo Promedio por Proyecto (€)", "Costo Total (€)", "{:,.0f}"),
+    ("Duración Promedio (meses)", "Duración (meses)", "{:,.1f}"),
+    ("Eficiencia Promedio (%)", "Eficiencia (%)", "{:,.1f}"),
+]
+
+
+def con_rentabilidad(df):
+    """Añade la rentabilidad de cada proyecto: eficiencia por cada 100 € de coste."""
+    return df.assign(**{"Rentabilidad (%)": (df["Eficiencia (%)"] / df["Costo Total (€)"]) * 100})
+
+
+def huella_cola(df, filas):
+    """Huella de las últimas ``FILAS_COLA`` de las primeras ``filas`` filas de ``df``."""
+    cola = df.iloc[max(0, filas - FILAS_COLA):filas]
+    return hashlib.sha256(pd.util.hash_pandas_object(cola, index=False).to_numpy().tobytes()).hexdigest()
+
+
+class Boceto:
+    """
+    Boceto de cuantiles fusionable: centroides (media, peso) ordenados más mínimo y máximo exactos.
+
+    Al superar ``CENTROIDES`` se agrupan en tramos de igual peso; con menos valores
+    guarda cada uno como centroide de peso 1 y los cuantiles coinciden con
+    ``np.quantile``.
+    """
+    __slots__ = ("medias", "pesos", "minimo", "maximo")
+
+    def __init__(self, medias=None, pesos=None, minimo=np.nan, maximo=np.nan):
+        self.medias = np.empty(0) if medias is None else medias
+        self.pesos = np.empty(0) if pesos is None else pesos
+        self.minimo, self.maximo = minimo, maximo
+
+    @property
+    def n(self):
+        return float(self.pesos.sum())
+
+    def fusionar(self, valores, centroides=CENTROIDES):
+        """Boceto nuevo con ``valores`` (sin NaN) añadidos; el original no se modifica."""
+        if len(valores) == 0:
+            return self
+        nuevos = np.sort(valores)
+        pesos_nuevos = np.ones(len(nuevos))
+        if len(nuevos) > centroides:
+            # Lotes grandes: primero a tramos de igual número de valores sobre el array ordenado
+            inicios = np.arange(centroides) * len(nuevos) // centroides
+            pesos_nuevos = np.diff(np.append(inicios, len(nuevos))).astype(float)
+            nuevos = np.add.reduceat(nuevos, inicios) / pesos_nuevos
+        medias = np.concatenate([self.medias, nuevos])
+        pesos = np.concatenate([self.pesos, pesos_nuevos])
+        orden = np.argsort(medias, kind="stable")
+        medias, pesos = medias[orden], pesos[orden]
+        if len(medias) > centroides:
+            # Tramo de cada centroide según el peso acumulado antes de él: tramos de igual peso
+            tramos = ((np.cumsum(pesos) - pesos) * centroides // pesos.sum()).astype(np.int64)
+            pesos_tramo = np.bincount(tramos, weights=pesos, minlength=centroides)
+            sumas = np.bincount(tramos, weights=medias * pesos, minlength=centroides)
+            ocupados = pesos_tramo > 0
+            medias, pesos = sumas[ocupados] / pesos_tramo[ocupados], pesos_tramo[ocupados]
+        return Boceto(medias, pesos, float(np.fmin(self.minimo, valores.min())),
+                      float(np.fmax(self.maximo, valores.max())))
+
+    def cuantiles(self, q):
+        """Cuantiles con interpolación lineal entre centroides (la de ``Series.quantile`` si son exactos)."""
+        q = np.asarray(q, dtype=float)
+        if len(self.pesos) == 0:
+            return np.full(q.shape, np.nan)
+        n = self.n
+        # Rango (base 0) del centro de cada centroide; los extremos exactos anclan la interpolación
+        centros = np.cumsum(self.pesos) - (self.pesos + 1) / 2
+        rangos = np.concatenate([[0.0], centros, [n - 1]])
+        valores = np.concatenate([[self.minimo], self.medias, [self.maximo]])
+        return np.interp(q * (n - 1), rangos, valores)
+
+    def valores(self):
+        """Valores representativos ordenados (extremos y centroides) para buscar bigotes."""
+        return np.concatenate([[self.minimo], self.medias, [self.maximo]]) if len(self.pesos) else np.empty(0)
+
+    def memoria_bytes(self):
+        return self.medias.nbytes + self.pesos.nbytes
+
+
+class _Grupo:
+    __slots__ = ("n", "validos", "suma", "suma_cuadrados", "bocetos")
+
+    def __init__(self, metricas):
+        self.n = 0
+        self.validos = np.zeros(len(metricas))
+        self.suma = np.zeros(len(metricas))
+        self.suma_cuadrados = np.zeros(len(metricas))
+        self.bocetos = [Boceto() for _ in metricas]
+
+    def anexar(self, valores):
+        """``valores``: matriz (filas, métricas) de las filas nuevas del grupo."""
+        # Se crean objetos nuevos en vez de modificar los existentes: las copias del almacén los comparten
+        self.n += len(valores)
+        self.validos = self.validos + np.sum(~np.isnan(valores), axis=0)
+        self.suma = self.suma + np.nansum(valores, axis=0)
+        self.suma_cuadrados = self.suma_cuadrados + np.nansum(valores ** 2, axis=0)
+        self.bocetos = [b.fusionar(nuevos[~np.isnan(nuevos)]) for b, nuevos in zip(self.bocetos, valores.T)]
+
+    def memoria_bytes(self):
+        return (self.validos.nbytes + self.suma.nbytes + self.suma_cuadrados.nbytes
+                + sum(b.memoria_bytes() for b in self.bocetos))
+
+    def copiar(self):
+        copia = _Grupo.__new__(_Grupo)
+        copia.n, copia.validos, copia.suma, copia.suma_cuadrados = self.n, self.validos, self.suma, self.suma_cuadrados
+        copia.bocetos = list(self.bocetos)
+        return copia
+
+
+class AlmacenAgregados:
+    def __init__(self, metricas=METRICAS, dimensiones=DIMENSIONES):
+        self.metricas = list(metricas)
+        self.dimensiones = list(dimensiones)
+        self._indice = {m: j for j, m in enumerate(self.metricas)}
+        self._grupos = {dimension: {} for dimension in self.dimensiones}
+        self.filas = 0
+        self.cola = None  # huella_cola del DataFrame incorporado (la fija obtener_agregados)
+
+    @classmethod
+    def desde_df(cls, df, **kwargs):
+        almacen = cls(**kwargs)
+        almacen.anexar(df)
+        return almacen
+
+    def copiar(self):
+        """Copia en O(categorías) que comparte los arrays con el original."""
+        copia = AlmacenAgregados(self.metricas, self.dimensiones)
+        copia._grupos = {d: {c: g.copiar() for c, g in grupos.items()} for d, grupos in self._grupos.items()}
+        copia.filas, copia.cola = self.filas, self.cola
+        return copia
+
+    def anexar(self, nuevas):
+        """Incorpora filas nuevas; el coste depende de ``len(nuevas)`` y no del histórico."""
+        if len(nuevas) == 0:
+            return self
+        if "Rentabilidad (%)" in self.metricas and "Rentabilidad (%)" not in nuevas:
+            nuevas = con_rentabilidad(nuevas)
+        metricas = [m for m in self.metricas if m in nuevas]
+        valores = np.full((len(nuevas), len(self.metricas)), np.nan)
+        for m in metricas:
+            valores[:, self._indice[m]] = pd.to_numeric(nuevas[m], errors="coerce").to_numpy(dtype=float)
+
+        for dimension in self.dimensiones:
+            grupos = self._grupos[dimension]
+            if dimension == TOTAL:
+                grupos.setdefault(TOTAL, _Grupo(self.metricas)).anexar(valores)
+                continue
+            codigos, categorias = pd.factorize(nuevas[dimension], sort=True)
+            orden = np.argsort(codigos, kind="stable")
+            cortes = np.searchsorted(codigos[orden], np.arange(len(categorias) + 1))
+            for k, categoria in enumerate(categorias):
+                filas = orden[cortes[k]:cortes[k + 1]]
+                grupos.setdefault(categoria, _Grupo(self.metricas)).anexar(valores[filas])
+        self.filas += len(nuevas)
+        return self
+
+    def memoria_bytes(self):
+        """Bytes que ocupan los arrays del almacén."""
+        return sum(g.memoria_bytes() for grupos in self._grupos.values() for g in grupos.values())
+
+    # 📊 Consultas
+
+    def categorias(self, dimension):
+        return sorted(self._grupos[dimension])
+
+    def conteos(self, dimension=TOTAL):
+        return pd.Series({c: g.n for c, g in sorted(self._grupos[dimension].items())}, name="Proyectos")
+
+    def medias(self, metrica, dimension=TOTAL):
+        j = self._indice[metrica]
+        return pd.Series({c: g.suma[j] / g.validos[j] if g.validos[j] else np.nan
+                          for c, g in sorted(self._grupos[dimension].items())}, name=metrica)
+
+    def media(self, metrica):
+        """Media global de ``metrica``."""
+        return float(self.medias(metrica)[TOTAL])
+
+    def extremos(self, metrica):
+        """``(mínimo, máximo)`` global de ``metrica``."""
+        boceto = self.boceto(metrica)
+        return boceto.minimo, boceto.maximo
+
+    def desviaciones(self, metrica, dimension=TOTAL):
+        j = self._indice[metrica]
+        resultado = {}
+        for c, g in sorted(self._grupos[dimension].items()):
+            n = g.validos[j]
+            varianza = (g.suma_cuadrados[j] - g.suma[j] ** 2 / n) / (n - 1) if n > 1 else np.nan
+            resultado[c] = np.sqrt(max(varianza, 0.0)) if n > 1 else np.nan
+        return pd.Series(resultado, name=metrica)
+
+    def cuantiles(self, metrica, q, dimension=TOTAL):
+        """Cuantiles del boceto (exactos hasta ``CENTROIDES`` valores por grupo)."""
+        j = self._indice[metrica]
+        return pd.DataFrame({c: g.bocetos[j].cuantiles(q) for c, g in sorted(self._grupos[dimension].items())},
+                            index=list(q)).T
+
+    def boceto(self, metrica, categoria=TOTAL, dimension=TOTAL):
+        """``Boceto`` de ``metrica`` en ``categoria`` de ``dimension``."""
+        return self._grupos[dimension][categoria].bocetos[self._indice[metrica]]
+
+    def resumen(self, metrica, dimension=TOTAL):
+        """Tabla por categoría: proyectos, media, desviación, mínimo, cuartiles y máximo."""
+        tabla = self.cuantiles(metrica, [0.0, 0.25, 0.5, 0.75, 1.0], dimension)
+        tabla.columns = ["Mín", "P25", "Mediana", "P75", "Máx"]
+        tabla.insert(0, "Desv.", self.desviaciones(metrica, dimension))
+        tabla.insert(0, "Media", self.medias(metrica, dimension))
+        tabla.insert(0, "Proyectos", self.conteos(dimension))
+        return tabla
+
+
+def tabla_competencia(agregados):
+    """Benchmarking con empresas del sector (datos de referencia ficticios más las medias de CFC)."""
+    return pd.DataFrame({
+        "Empresa": ["Constructora A", "Constructora B", "Constructora C", "CFC"],
+        "Costo Promedio (€)": [2500000, 2300000, 2800000, agregados.media("Costo Total (€)")],
+        "Eficiencia (%)": [78, 82, 76, agregados.media("Eficiencia (%)")],
+        "Satisfacción Cliente (1-5)": [4.0, 4.5, 3.8, agregados.media("Satisfacción Cliente (1-5)")]
+    })
+
+
+# 📌 Un almacén por archivo de datos: ruta -> (versión, AlmacenAgregados)
+_almacenes = {}
+_bloqueo = threading.Lock()
+
+
+def obtener_agregados(conjunto):
+    """
+    Agregados del ``ConjuntoDatos`` (ver ``datos.obtener_datos``), calculados una vez por versión.
+
+    Si la versión nueva tiene más filas que la anterior y la cola de lo ya
+    incorporado no ha cambiado, solo se procesan las filas añadidas. La
+    comprobación cuesta O(``FILAS_COLA``): si además de añadir filas se editó
+    alguna anterior a la cola, la edición no se refleja hasta que se vacíe la caché.
+    """
+    with _bloqueo:
+        vigente = _almacenes.get(conjunto.ruta)
+        if vigente is not None and vigente[0] == conjunto.version:
+            return vigente[1]
+        almacen = _calcular(conjunto, vigente)
+        _almacenes[conjunto.ruta] = (conjunto.version, almacen)
+    datos.ajustar_memoria(protegida=conjunto.ruta)
+    return almacen
+
+
+def _calcular(conjunto, vigente):
+    """Almacén de la versión actual: incremental si solo se añadieron filas al final."""
+    df = conjunto.df
+    almacen = None
+    if vigente is not None:
+        anterior = vigente[1]
+        if anterior.filas < len(df) and huella_cola(df, anterior.filas) == anterior.cola:
+            # Las sesiones que aún leen el almacén anterior no ven estados intermedios
+            almacen = anterior.copiar().anexar(df.iloc[anterior.filas:])
+    if almacen is None:
+        almacen = AlmacenAgregados.desde_df(df)
+    almacen.cola = huella_cola(df, len(df))
+    return almacen
+
+
+def _memoria(ruta):
+    with _bloqueo:
+        vigente = _almacenes.get(ruta)
+    return vigente[1].memoria_bytes() if vigente is not None else 0
+
+
+def _olvidar(ruta):
+    with _bloqueo:
+        _almacenes.pop(ruta, None)
+
+
+datos.registrar_derivada(_memoria, _olvidar)
+
+
+def vaciar_cache():
+    """Olvida los almacenes calculados (se recalcularán en la siguiente consulta)."""
+    with _bloqueo:
+        _almacenes.clear()
@@ -0,0 +1,182 @@
+"""
+⏱️ Benchmark de extremo a extremo de la aplicación a distintas escalas.
+
+Para cada tamaño genera un dataset con ``generador.py`` y mide, en frío y en
+caliente, la carga de datos, los agregados, la codificación, la predicción de una
+fila y de un lote, el renderizado de cada figura y cada página de ``app.py``
+(ejecutada con ``streamlit.testing``). Cada fase se repite con ``tracemalloc``
+activo para registrar su pico de memoria (asignaciones de Python y NumPy; las de
+Arrow no se ven ahí, por eso el informe incluye también el RSS máximo del proceso)
+y el resultado se guarda en JSON.
+
+Uso::
+
+    python benchmarks/bench_app.py --filas 1000 100000 1000000 --salida bench_app.json
+    python benchmarks/bench_app.py --filas 1000 --comparar bench_app.json   # sale con 1 si hay regresiones
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import agregados  # noqa: E402
+import datos  # noqa: E402
+import generador  # noqa: E402
+import graficos  # noqa: E402
+from lotes import puntuar_archivo  # noqa: E402
+from pipeline import obtener_pipeline  # noqa: E402
+
+PAGINAS = ["Presentación y Datos", "Modelo Predictivo", "Conclusiones y Perfil"]
+FIGURAS = ["distribucion_costos", "duracion_vs_costo", "eficiencia_por_material", "satisfaccion_por_tipo",
+           "eficiencia_por_clima"]
+PROYECTO = {"Tipo de Construcción": "Comercial", "Duración (meses)": 18, "Costo Total (€)": 1_500_000,
+            "Material Principal": "Hormigón", "Clima Predominante": "Templado"}
+
+
+def vaciar_caches():
+    datos.vaciar_cache()
+    agregados.vaciar_cache()
+    graficos.cache_figuras.vaciar()
+
+
+def medir(funcion, memoria=True):
+    """Devuelve ``(segundos, pico_mb)``; el pico se mide en una segunda ejecución con tracemalloc."""
+    inicio = time.perf_counter()
+    funcion()
+    segundos = time.perf_counter() - inicio
+    pico = None
+    if memoria:
+        tracemalloc.start()
+        try:
+            funcion()
+            pico = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        finally:
+            tracemalloc.stop()
+    return segundos, pico
+
+
+class Pagina:
+    """Ejecuta una página de ``app.py`` con ``AppTest``; ``fria`` vacía antes las cachés del proceso."""
+
+    def __init__(self, nombre):
+        from streamlit.testing.v1 import AppTest
+
+        self.nombre = nombre
+        self.app = AppTest.from_file(os.path.join(RAIZ, "app.py"), default_timeout=3600)
+        self.app.run()
+
+    def __call__(self, fria):
+        if fria:
+            vaciar_caches()
+        if self.app.sidebar.radio[0].value != self.nombre:
+            self.app.sidebar.radio[0].set_value(self.nombre)
+        self.app.run()
+        if self.app.exception:
+            raise RuntimeError(f"La página '{self.nombre}' lanzó: {self.app.exception[0].value}")
+
+
+def fases(filas, archivo, directorio):
+    """Pares ``(nombre, función)`` a medir para un dataset."""
+    def cargar_frio():
+        vaciar_caches()
+        for resto in os.listdir(datos.DIRECTORIO_CACHE) if os.path.isdir(datos.DIRECTORIO_CACHE) else []:
+            os.remove(os.path.join(datos.DIRECTORIO_CACHE, resto))
+        datos.obtener_datos(archivo)
+
+    conjunto = lambda: datos.obtener_datos(archivo)  # noqa: E731
+    pipeline, _ = obtener_pipeline()
+
+    def una_fila(repeticiones=1000):
+        for _ in range(repeticiones):
+            pipeline.predecir_fila(**PROYECTO)
+
+    yield "datos_frio", cargar_frio
+    yield "datos_caliente", conjunto
+    yield "agregados_frio", lambda: (agregados.vaciar_cache(), agregados.obtener_agregados(conjunto()))
+    yield "codificacion", lambda: pipeline.codificar(conjunto().df)
+    yield "prediccion_fila_x1000", una_fila
+    yield "prediccion_lote", lambda: puntuar_archivo(archivo, os.path.join(directorio, "salida.parquet"), pipeline)
+    for nombre in FIGURAS:
+        figura = getattr(graficos, nombre)
+        argumentos = (conjunto().df,) if nombre in ("distribucion_costos", "duracion_vs_costo") else \
+            (conjunto().df, agregados.obtener_agregados(conjunto()))
+        yield f"figura:{nombre}", lambda f=figura, a=argumentos: graficos.a_png(f(*a))
+    for nombre in PAGINAS:
+        pagina = Pagina(nombre)
+        yield f"pagina:{nombre}:fria", lambda p=pagina: p(fria=True)
+        yield f"pagina:{nombre}:caliente", lambda p=pagina: p(fria=False)
+
+
+def ejecutar(filas_lista, formato, memoria):
+    resultados = []
+    with tempfile.TemporaryDirectory() as directorio:
+        datos.DIRECTORIO_CACHE = os.path.join(directorio, "cache")
+        for filas in filas_lista:
+            archivo = generador.escribir(os.path.join(directorio, f"proyectos_{filas}{formato}"), filas)
+            datos.ARCHIVO_DATOS = archivo  # app.py lo lee al ejecutarse
+            for fase, funcion in fases(filas, archivo, directorio):
+                segundos, pico = medir(funcion, memoria)
+                resultados.append({"filas": filas, "fase": fase, "segundos": round(segundos, 6),
+                                   "pico_mb": None if pico is None else round(pico, 2)})
+                pico_texto = "" if pico is None else f" | pico {pico:9.1f} MB"
+                print(f"{filas:>10,} | {fase:<45} | {segundos:10.4f} s{pico_texto}", flush=True)
+    return resultados
+
+
+def comparar(actual, referencia, tolerancia):
+    """Fases cuya duración supera a la de referencia en más de ``tolerancia`` (fracción)."""
+    previos = {(r["filas"], r["fase"]): r["segundos"] for r in referencia["resultados"]}
+    regresiones = []
+    for r in actual:
+        previo = previos.get((r["filas"], r["fase"]))
+        if previo and r["segundos"] > previo * (1 + tolerancia) and r["segundos"] - previo > 0.005:
+            regresiones.append((r["filas"], r["fase"], previo, r["segundos"]))
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--formato", choices=generador.FORMATOS, default=".parquet")
+    parser.add_argument("--salida", default="bench_app.json")
+    parser.add_argument("--sin-memoria", action="store_true", help="No repetir las fases con tracemalloc")
+    parser.add_argument("--comparar", help="Informe JSON anterior con el que comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.25)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    resultados = ejecutar(args.filas, args.formato, not args.sin_memoria)
+    informe = {
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "cpus": os.cpu_count(),
+        "formato": args.formato,
+        "rss_max_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "resultados": resultados,
+    }
+    with open(args.salida, "w", encoding="utf-8") as f:
+        json.dump(informe, f, ensure_ascii=False, indent=2)
+    print(f"📄 Informe guardado en '{args.salida}'")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            regresiones = comparar(resultados, json.load(f), args.tolerancia)
+        for filas, fase, previo, ahora in regresiones:
+            print(f"❌ {filas:,} | {fase}: {previo:.4f} s -> {ahora:.4f} s")
+        if regresiones:
+            sys.exit(1)
+        print("✅ Sin regresiones respecto a la referencia")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+⏱️ Presupuesto de arranque en frío de la aplicación.
+
+Cada medida se toma en un proceso de Python nuevo, como una réplica recién
+escalada:
+
+- ``arranque``: importaciones de ``app.py`` (streamlit, ``paginas``, instrumentación).
+- ``importar:<página>``: importación del módulo de cada página sobre el arranque, y
+  si arrastra alguna biblioteca pesada (``PESADAS``).
+- ``primera:<página>``: desde que arranca el proceso hasta que la página termina
+  de dibujarse por primera vez (con la precarga en segundo plano desactivada).
+
+Se toma el mínimo de ``--repeticiones`` procesos y se compara con ``PRESUPUESTOS_MS``
+(escalables con ``--factor`` en máquinas más lentas). Sale con 1 si se supera algún
+presupuesto o una página importa una biblioteca que no le corresponde.
+
+Uso::
+
+    python benchmarks/bench_arranque.py
+    python benchmarks/bench_arranque.py --factor 2 --sin-primera
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from paginas import PAGINAS  # noqa: E402
+
+# Ninguna página debe importarlas al cargarse: se cargan al dibujar o al deserializar el modelo
+PESADAS = ("sklearn", "seaborn", "matplotlib", "scipy")
+PRESUPUESTOS_MS = {
+    "arranque": 1_500,
+    "importar": 1_000,  # incluye pandas, que todas las páginas usan
+    "primera:Presentación y Datos": 12_000,
+    "primera:Modelo Predictivo": 12_000,
+    "primera:Conclusiones y Perfil": 8_000,
+}
+
+_IMPORTAR = """
+import json, sys, time
+inicio = time.perf_counter()
+import streamlit, paginas, instrumentacion
+arranque = time.perf_counter() - inicio
+modulo = {modulo!r}
+inicio = time.perf_counter()
+if modulo:
+    __import__(modulo)
+pagina = time.perf_counter() - inicio
+print(json.dumps({{"arranque": arranque, "pagina": pagina,
+                   "pesadas": [m for m in {pesadas!r} if m in sys.modules]}}))
+"""
+
+_PRIMERA = """
+import json, time
+inicio = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file("app.py", default_timeout=600)
+app.session_state["pagina"] = {pagina!r}
+app.run()
+print(json.dumps({{"segundos": time.perf_counter() - inicio, "errores": [str(e.value) for e in app.exception]}}))
+"""
+
+
+def en_proceso_nuevo(codigo):
+    entorno = dict(os.environ, CFC_PRECARGA="0", PYTHONWARNINGS="ignore")
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, env=entorno, capture_output=True, text=True,
+                            check=True)
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def minimo(codigo, clave, repeticiones):
+    resultados = [en_proceso_nuevo(codigo) for _ in range(repeticiones)]
+    return min(resultados, key=lambda r: r[clave])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--factor", type=float, default=1.0, help="Multiplicador de los presupuestos")
+    parser.add_argument("--sin-primera", action="store_true", help="Medir solo importaciones")
+    args = parser.parse_args()
+
+    fallos = []
+
+    def comprobar(nombre, ms, presupuesto):
+        limite = presupuesto * args.factor
+        estado = "✔" if ms <= limite else "✘"
+        if ms > limite:
+            fallos.append(nombre)
+        print(f"{estado} {nombre:<36} {ms:8,.0f} ms   (presupuesto {limite:,.0f} ms)")
+
+    base = minimo(_IMPORTAR.format(modulo=None, pesadas=PESADAS), "arranque", args.repeticiones)
+    comprobar("arranque", base["arranque"] * 1000, PRESUPUESTOS_MS["arranque"])
+    if base["pesadas"]:
+        fallos.append("arranque")
+        print(f"✘ el arranque importa {', '.join(base['pesadas'])}")
+
+    for pagina, modulo in PAGINAS.items():
+        r = minimo(_IMPORTAR.format(modulo=modulo, pesadas=PESADAS), "pagina", args.repeticiones)
+        comprobar(f"importar:{pagina}", r["pagina"] * 1000, PRESUPUESTOS_MS["importar"])
+        if r["pesadas"]:
+            fallos.append(f"importar:{pagina}")
+            print(f"✘ {modulo} importa {', '.join(r['pesadas'])}")
+
+    if not args.sin_primera:
+        for pagina in PAGINAS:
+            r = minimo(_PRIMERA.format(pagina=pagina), "segundos", 1)
+            comprobar(f"primera:{pagina}", r["segundos"] * 1000, PRESUPUESTOS_MS[f"primera:{pagina}"])
+            if r["errores"]:
+                fallos.append(f"primera:{pagina}")
+                print(f"✘ {pagina}: {r['errores'][0]}")
+
+    if fallos:
+        print(f"\n❌ Fuera de presupuesto: {', '.join(fallos)}")
+        sys.exit(1)
+    print("\n✅ Todo dentro de presupuesto")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+⏱️ Benchmark de carga en frío y en caliente de la capa de datos.
+
+Para cada tamaño genera un libro Excel con ``generador.py`` y mide tres situaciones:
+
+- frío: primera lectura (parseo del Excel + escritura de la copia Parquet)
+- caliente en disco: proceso nuevo que encuentra la copia Parquet
+- caliente en memoria: llamada repetida dentro del mismo proceso
+
+Uso::
+
+    python benchmarks/bench_datos.py --filas 1000 100000 1000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import datos  # noqa: E402
+from generador import generar_df  # noqa: E402
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def medir(filas, directorio):
+    archivo = os.path.join(directorio, f"proyectos_{filas}.xlsx")
+    generar_df(filas).to_excel(archivo, index=False)
+
+    datos.vaciar_cache()
+    frio = cronometrar(lambda: datos.obtener_datos(archivo))
+    datos.vaciar_cache()  # equivale a un proceso nuevo que ya tiene la copia Parquet
+    disco = cronometrar(lambda: datos.obtener_datos(archivo))
+    memoria = cronometrar(lambda: datos.obtener_datos(archivo))
+    excel = cronometrar(lambda: pd.read_excel(archivo))  # referencia: comportamiento anterior
+
+    print(f"{filas:>9,} filas | read_excel {excel:9.3f} s | frío {frio:9.3f} s | "
+          f"caliente disco {disco:8.4f} s | caliente memoria {memoria * 1e6:8.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        datos.DIRECTORIO_CACHE = os.path.join(directorio, "cache")
+        for filas in args.filas:
+            medir(filas, directorio)
+
+
+if __name__ == "__main__":
+    main()
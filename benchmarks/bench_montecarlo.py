@@ -0,0 +1,70 @@
+"""
+⏱️ Benchmark del motor Monte Carlo.
+
+Comprueba que el resultado no depende del número de procesos y mide la latencia
+de un proyecto (objetivo: muy por debajo de 1 s con 200.000 escenarios) y el
+rendimiento con una cartera completa en uno y en varios procesos.
+
+Uso::
+
+    python benchmarks/bench_montecarlo.py --escenarios 200000 --cartera 1000 --procesos 8
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from generador import generar_df  # noqa: E402
+from montecarlo import Incertidumbre, simular, simular_cartera  # noqa: E402
+from pipeline import obtener_pipeline  # noqa: E402
+
+PROYECTO = {"Tipo de Construcción": "Comercial", "Duración (meses)": 18, "Costo Total (€)": 1_500_000,
+            "Material Principal": "Acero", "Clima Predominante": "Seco"}
+INCERTIDUMBRE = Incertidumbre(2.0, (0.0, 0.2), {"Húmedo": 0.3, "Seco": 0.3, "Templado": 0.4}, sigma_residual=0.7)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--escenarios", type=int, default=200_000)
+    parser.add_argument("--cartera", type=int, default=1_000, help="Proyectos de la cartera")
+    parser.add_argument("--escenarios-cartera", type=int, default=20_000)
+    parser.add_argument("--procesos", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    os.chdir(RAIZ)
+    pipeline, version = obtener_pipeline()
+    print(f"Modelo {version} · {args.procesos} procesos")
+
+    # ✔ Reproducibilidad
+    simular(pipeline, PROYECTO, INCERTIDUMBRE, 10_000)  # calentamiento
+    uno = simular(pipeline, PROYECTO, INCERTIDUMBRE, args.escenarios)
+    varios = simular(pipeline, PROYECTO, INCERTIDUMBRE, args.escenarios, procesos=args.procesos)
+    assert uno.percentiles == varios.percentiles, "El resultado depende del número de procesos"
+    print(f"✔ Mismo resultado con 1 y {args.procesos} procesos")
+
+    # ⏱️ Un proyecto
+    mejor = min(simular(pipeline, PROYECTO, INCERTIDUMBRE, args.escenarios).segundos for _ in range(5))
+    print(f"1 proyecto  | {args.escenarios:,} escenarios en {mejor * 1000:7.1f} ms "
+          f"({args.escenarios / mejor:,.0f} escenarios/s)")
+
+    # ⏱️ Cartera
+    cartera = generar_df(args.cartera, semilla=1).drop(columns=["Proyecto"])
+    total = args.cartera * args.escenarios_cartera
+    tiempos = {}
+    for procesos in sorted({1, args.procesos}):
+        inicio = time.perf_counter()
+        simular_cartera(pipeline, cartera, INCERTIDUMBRE, args.escenarios_cartera, procesos=procesos)
+        tiempos[procesos] = time.perf_counter() - inicio
+        print(f"cartera     | {args.cartera:,} proyectos × {args.escenarios_cartera:,} escenarios, "
+              f"{procesos:>2} proceso(s): {tiempos[procesos]:6.2f} s ({total / tiempos[procesos]:,.0f} escenarios/s)")
+    if len(tiempos) > 1:
+        print(f"aceleración | ×{tiempos[1] / tiempos[args.procesos]:.1f}")
+
+
+if __name__ == "__main__":
+    main()
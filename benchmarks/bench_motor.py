@@ -0,0 +1,81 @@
+"""
+⏱️ Microbenchmark del motor lineal frente a ``model.predict``.
+
+Comprueba primero la paridad numérica entre ambos caminos y después mide la
+latencia por llamada con una fila y el rendimiento con un lote de 1M filas.
+
+Uso::
+
+    python benchmarks/bench_motor.py --filas 1000000
+"""
+import argparse
+import os
+import sys
+import timeit
+import warnings
+
+import numpy as np
+import pandas as pd
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from modelos import ARCHIVO_MODELO, obtener_modelo  # noqa: E402
+from motor import MotorLineal  # noqa: E402
+from prediccion import COLUMNAS_MODELO  # noqa: E402
+
+
+def matriz_aleatoria(filas, semilla=0):
+    rng = np.random.default_rng(semilla)
+    return np.column_stack([
+        np.zeros(filas),
+        rng.integers(0, 9, filas),
+        rng.integers(6, 48, filas),
+        rng.integers(500_000, 10_000_000, filas),
+        rng.integers(0, 4, filas),
+        rng.integers(0, 3, filas),
+        rng.integers(60, 100, filas),
+        rng.integers(30, 51, filas) / 10,
+    ]).astype(float)
+
+
+def por_llamada(funcion, repeticiones):
+    return min(timeit.repeat(funcion, number=repeticiones, repeat=5)) / repeticiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=1_000_000)
+    parser.add_argument("--modelo", default=os.path.join(RAIZ, ARCHIVO_MODELO))
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    modelo = obtener_modelo(args.modelo).objeto
+    motor = MotorLineal.desde_modelo(modelo)
+
+    # ✔ Paridad con scikit-learn
+    X = matriz_aleatoria(args.filas)
+    referencia = modelo.predict(pd.DataFrame(X, columns=COLUMNAS_MODELO))
+    np.testing.assert_allclose(motor.puntuar(X), referencia, rtol=1e-10, atol=1e-8)
+    np.testing.assert_allclose([motor.puntuar(fila) for fila in X[:1000]], referencia[:1000], rtol=1e-10, atol=1e-8)
+    print(f"✔ Paridad con model.predict en {args.filas:,} filas")
+
+    # ⏱️ Una fila
+    fila = X[0]
+    df_fila = pd.DataFrame([fila], columns=COLUMNAS_MODELO)
+    sklearn_fila = por_llamada(lambda: modelo.predict(pd.DataFrame([fila], columns=COLUMNAS_MODELO).astype(float)), 200)
+    sklearn_fila_sin_df = por_llamada(lambda: modelo.predict(df_fila), 200)
+    motor_fila = por_llamada(lambda: motor.puntuar(fila), 20_000)
+    print(f"1 fila  | DataFrame + predict {sklearn_fila * 1e6:9.1f} µs | predict {sklearn_fila_sin_df * 1e6:9.1f} µs "
+          f"| motor {motor_fila * 1e6:7.2f} µs")
+
+    # ⏱️ Lote
+    df_lote = pd.DataFrame(X, columns=COLUMNAS_MODELO)
+    sklearn_lote = por_llamada(lambda: modelo.predict(df_lote), 3)
+    motor_lote = por_llamada(lambda: motor.puntuar(X), 3)
+    print(f"{args.filas:,} filas | predict {args.filas / sklearn_lote:,.0f} filas/s | "
+          f"motor {args.filas / motor_lote:,.0f} filas/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+⏱️ Imágenes estáticas por página: payload del websocket por rerun, bytes servidos por ``/media`` y coste en el servidor.
+
+Se usa el camino real de ``st.image`` (``marshall_images`` con un ``Runtime`` y su
+gestor de medios en memoria) para tres entradas:
+
+- ``ruta``: ``st.image("archivo", width=...)``, lo que hacía la app: en cada rerun
+  Streamlit lee el original, lo reduce y lo recodifica antes de registrarlo.
+- ``data:``: un ``data:`` URI con la imagen ya reducida, que viaja entero en el
+  mensaje de cada rerun.
+- ``bytes``: ``recursos.obtener(...).datos``, bytes ya al ancho exacto que Streamlit
+  registra tal cual.
+
+Con ``ruta`` y ``bytes`` el mensaje de cada rerun solo lleva la URL ``/media/...``;
+la imagen se descarga por HTTP una vez (la URL depende del contenido y no cambia
+entre reruns). Para cada página se suman sus imágenes (el logo aparece en todas).
+
+Uso::
+
+    python benchmarks/bench_recursos.py --repeticiones 50
+"""
+import argparse
+import base64
+import logging
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import recursos  # noqa: E402
+
+PAGINAS_IMAGENES = {
+    "Presentación y Datos": ["CFC.png"],
+    "Modelo Predictivo": ["CFC.png"],
+    "Conclusiones y Perfil": ["CFC.png", "cris.jpg", "ironhack.jpg", "uned.jpg"],
+}
+
+
+def iniciar_runtime():
+    """``Runtime`` de Streamlit sin servidor, para que ``st.image`` registre los medios; devuelve su almacén."""
+    from streamlit.runtime import Runtime, RuntimeConfig
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+
+    # Fuera de un script no hay ScriptRunContext; el aviso es esperado
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(logging.ERROR)
+    almacen = MemoryMediaFileStorage("/media")
+    Runtime(RuntimeConfig(script_path=os.path.join(RAIZ, "app.py"), media_file_storage=almacen,
+                          uploaded_file_manager=MemoryUploadedFileManager("/_stcore/upload_file")))
+    return almacen
+
+
+def como_st_image(imagen, ancho):
+    """Marshalling de ``st.image(imagen, width=ancho)``: devuelve el proto que viaja en el rerun."""
+    from streamlit.elements.lib.image_utils import marshall_images
+    from streamlit.elements.lib.layout_utils import LayoutConfig
+    from streamlit.proto.Image_pb2 import ImageList
+
+    proto = ImageList()
+    marshall_images("bench", imagen, None, LayoutConfig(width=ancho), proto, clamp=False)
+    return proto
+
+
+def bytes_media(almacen, proto):
+    """Bytes que sirve ``/media`` para la imagen del proto (0 si viaja en el propio mensaje)."""
+    url = proto.imgs[0].url
+    if not url.startswith("/media/"):
+        return 0
+    return len(almacen.get_file(url.rsplit("/", 1)[1].split(".")[0]).content)
+
+
+def medir(funcion, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+    os.chdir(RAIZ)
+    almacen = iniciar_runtime()
+
+    recursos.vaciar_cache()
+    inicio = time.perf_counter()
+    preparados = recursos.preparar_todas()
+    print(f"Preparación en frío de {len(preparados)} imágenes: {(time.perf_counter() - inicio) * 1000:.1f} ms\n")
+
+    entradas = {
+        "ruta": lambda nombre, ancho: nombre,
+        "data:": lambda nombre, ancho: (lambda r: f"data:{r.mime};base64,{base64.b64encode(r.datos).decode()}")(
+            recursos.obtener(nombre, ancho)),
+        "bytes": lambda nombre, ancho: recursos.obtener(nombre, ancho).datos,
+    }
+    print(f"{'Página':<24} " + " ".join(f"{'B/rerun ' + e:>15}" for e in entradas) + " "
+          + " ".join(f"{'KB /media ' + e:>15}" for e in entradas) + " "
+          + " ".join(f"{'ms ' + e:>9}" for e in entradas))
+    for pagina, imagenes in PAGINAS_IMAGENES.items():
+        websocket, media, ms = ({e: 0.0 for e in entradas} for _ in range(3))
+        for nombre in imagenes:
+            ancho = recursos.IMAGENES[nombre]
+            for entrada, preparar in entradas.items():
+                # El coste por rerun incluye obtener la entrada (la caché de recursos ya está caliente)
+                segundos, proto = medir(lambda: como_st_image(preparar(nombre, ancho), ancho), args.repeticiones)
+                websocket[entrada] += proto.ByteSize()
+                media[entrada] += bytes_media(almacen, proto)
+                ms[entrada] += segundos * 1000
+        print(f"{pagina:<24} " + " ".join(f"{websocket[e]:15,.0f}" for e in entradas) + " "
+              + " ".join(f"{media[e] / 1024:15.1f}" for e in entradas) + " "
+              + " ".join(f"{ms[e]:9.2f}" for e in entradas))
+    print("\nB/rerun: bytes del proto ImageList en cada rerun; KB /media: descarga HTTP, una vez por navegador.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+📂 Capa de acceso a datos con caché columnar.
+
+El libro Excel se convierte una sola vez a Parquet y, a partir de ahí, todas las
+lecturas salen de esa copia columnar. La caché se invalida cuando cambia la fecha
+de modificación o el contenido (hash SHA-256) del archivo fuente, y el DataFrame
+resultante se comparte entre todas las sesiones de Streamlit del proceso.
+
+El DataFrame compartido debe tratarse como de solo lectura: para añadir columnas
+usar ``df.assign(...)`` o trabajar sobre ``df.copy()``.
+
+Los DataFrames se guardan compactos (categorías para tipo, material y clima, y
+enteros con el tipo más pequeño que los contiene). Los que estén en memoria, junto
+con lo que otras cachés derivan de ellos (agregados), se expulsan por orden LRU
+cuando superan ``CFC_MEMORIA_DATOS_MB``.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import pandas as pd
+
+from instrumentacion import tramo
+from prediccion import COLUMNAS_CATEGORICAS
+
+ARCHIVO_DATOS = os.environ.get("CFC_DATOS", "datos_sinteticos.xlsx")
+DIRECTORIO_CACHE = os.environ.get("CFC_CACHE", ".cache_cfc")
+PRESUPUESTO_MEMORIA_MB = float(os.environ.get("CFC_MEMORIA_DATOS_MB", 1024))
+
+EXTENSIONES_EXCEL = (".xlsx", ".xls", ".xlsm", ".ods")
+
+
+@dataclass(frozen=True)
+class ConjuntoDatos:
+    """DataFrame compartido junto con la versión (hash) del archivo del que procede."""
+    df: pd.DataFrame
+    version: str
+    ruta: str
+    memoria_bytes: int = 0
+
+
+# 🔒 Caché de proceso (orden LRU): ruta absoluta -> (sello de fichero, ConjuntoDatos)
+_conjuntos = OrderedDict()
+_bloqueos = {}
+_bloqueo_global = threading.Lock()
+# Cachés derivadas de cada ruta: (medir(ruta) -> bytes, olvidar(ruta))
+_derivadas = []
+
+
+def huella_archivo(ruta, tam_bloque=1 << 20):
+    """Devuelve el SHA-256 del contenido del archivo."""
+    h = hashlib.sha256()
+    with open(ruta, "rb") as f:
+        for bloque in iter(lambda: f.read(tam_bloque), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def leer_fuente(ruta):
+    """Lee el archivo original según su extensión (Excel, CSV o Parquet)."""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension in EXTENSIONES_EXCEL:
+        return pd.read_excel(ruta)
+    if extension == ".csv":
+        return pd.read_csv(ruta)
+    if extension == ".parquet":
+        return pd.read_parquet(ruta)
+    raise ValueError(f"Formato de datos no soportado: '{ruta}'")
+
+
+def compactar(df):
+    """Categorías para las columnas categóricas y enteros reducidos al tipo mínimo."""
+    cambios = {}
+    for col in df.columns:
+        serie = df[col]
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            continue
+        if col in COLUMNAS_CATEGORICAS:
+            cambios[col] = serie.astype("category")
+        elif pd.api.types.is_integer_dtype(serie):
+            reducida = pd.to_numeric(serie, downcast="integer")
+            if reducida.dtype != serie.dtype:
+                cambios[col] = reducida
+    return df.assign(**cambios) if cambios else df
+
+
+def _prefijo_cache(ruta):
+    # El nombre incluye un hash de la ruta para no mezclar archivos homónimos de distintas carpetas
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    return f"{nombre}-{hashlib.sha1(ruta.encode()).hexdigest()[:8]}-"
+
+
+def _ruta_cache(ruta, version):
+    return os.path.join(DIRECTORIO_CACHE, f"{_prefijo_cache(ruta)}{version[:16]}.parquet")
+
+
+def _limpiar_versiones_antiguas(ruta, vigente):
+    prefijo = _prefijo_cache(ruta)
+    for archivo in os.listdir(DIRECTORIO_CACHE):
+        candidato = os.path.join(DIRECTORIO_CACHE, archivo)
+        if archivo.startswith(prefijo) and archivo.endswith(".parquet") and candidato != vigente:
+            try:
+                os.remove(candidato)
+            except OSError:
+                pass
+
+
+def _cargar(ruta, version):
+    """Carga desde la copia Parquet si existe para esta versión; si no, la genera."""
+    cache = _ruta_cache(ruta, version)
+
+    if os.path.exists(cache):
+        df = compactar(pd.read_parquet(cache, memory_map=True))
+    else:
+        df = compactar(leer_fuente(ruta))
+        os.makedirs(DIRECTORIO_CACHE, exist_ok=True)
+        temporal = f"{cache}.{os.getpid()}.tmp"
+        df.to_parquet(temporal, index=False)
+        os.replace(temporal, cache)  # escritura atómica frente a otros procesos
+        _limpiar_versiones_antiguas(ruta, cache)
+
+    return ConjuntoDatos(df=df, version=version, ruta=ruta, memoria_bytes=int(df.memory_usage(deep=True).sum()))
+
+
+def obtener_datos(archivo=ARCHIVO_DATOS):
+    """
+    Devuelve el ``ConjuntoDatos`` de ``archivo`` compartido por todo el proceso.
+
+    En cada llamada solo se consulta ``os.stat``; el archivo se vuelve a procesar
+    únicamente si cambian su fecha de modificación o su tamaño.
+    """
+    ruta = os.path.abspath(archivo)
+    info = os.stat(ruta)  # FileNotFoundError si el archivo no existe
+    sello = (info.st_mtime_ns, info.st_size)
+
+    with _bloqueo_global:
+        vigente = _conjuntos.get(ruta)
+        if vigente is not None and vigente[0] == sello:
+            _conjuntos.move_to_end(ruta)
+            return vigente[1]
+        bloqueo = _bloqueos.setdefault(ruta, threading.Lock())
+
+    # Solo una sesión recarga cada archivo; las demás esperan y reutilizan el resultado
+    with bloqueo:
+        vigente = _conjuntos.get(ruta)
+        if vigente is not None and vigente[0] == sello:
+            return vigente[1]
+        with tramo(f"datos:hash {os.path.basename(ruta)}"):
+            version = huella_archivo(ruta)
+        # Si solo cambió la fecha pero no el contenido, se conserva el DataFrame ya cargado
+        if vigente is not None and vigente[1].version == version:
+            conjunto = vigente[1]
+        else:
+            with tramo(f"datos:cargar {os.path.basename(ruta)}"):
+                conjunto = _cargar(ruta, version)
+        with _bloqueo_global:
+            _conjuntos[ruta] = (sello, conjunto)
+            _conjuntos.move_to_end(ruta)
+    ajustar_memoria(protegida=ruta)
+    return conjunto
+
+
+def cargar_datos(archivo=ARCHIVO_DATOS):
+    """Atajo que devuelve directamente el DataFrame compartido."""
+    return obtener_datos(archivo).df
+
+
+# 🧮 Presupuesto de memoria
+
+def registrar_derivada(medir, olvidar):
+    """
+    Incluye en el presupuesto una caché derivada de los datos (p. ej. agregados).
+
+    ``medir(ruta)`` devuelve los bytes que ocupa lo derivado de ``ruta`` y
+    ``olvidar(ruta)`` lo descarta cuando se expulsa ese conjunto.
+    """
+    _derivadas.append((medir, olvidar))
+
+
+def memoria_en_uso():
+    """``{ruta: bytes}`` de cada conjunto en memoria más sus cachés derivadas, de menos a más reciente."""
+    with _bloqueo_global:
+        conjuntos = [(ruta, conjunto.memoria_bytes) for ruta, (_, conjunto) in _conjuntos.items()]
+    return {ruta: propios + sum(medir(ruta) for medir, _ in _derivadas) for ruta, propios in conjuntos}
+
+
+def ajustar_memoria(protegida=None, presupuesto_mb=None):
+    """
+    Expulsa los conjuntos usados hace más tiempo hasta respetar el presupuesto.
+
+    ``protegida`` (el conjunto que se acaba de pedir) nunca se expulsa, aunque por
+    sí solo supere el presupuesto. Devuelve las rutas expulsadas.
+    """
+    limite = (PRESUPUESTO_MEMORIA_MB if presupuesto_mb is None else presupuesto_mb) * 2 ** 20
+    en_uso = memoria_en_uso()
+    total = sum(en_uso.values())
+    expulsadas = []
+    for ruta, tam in en_uso.items():
+        if total <= limite:
+            break
+        if ruta == protegida:
+            continue
+        expulsadas.append(ruta)
+        total -= tam
+    with _bloqueo_global:
+        for ruta in expulsadas:
+            _conjuntos.pop(ruta, None)
+    # Fuera del bloqueo global: las cachés derivadas tienen sus propios bloqueos
+    for ruta in expulsadas:
+        for _, olvidar in _derivadas:
+            olvidar(ruta)
+    return expulsadas
+
+
+def vaciar_cache():
+    """Olvida los DataFrames en memoria (la copia Parquet en disco se conserva)."""
+    with _bloqueo_global:
+        _conjuntos.clear()
@@ -0,0 +1,279 @@
+"""
+🏗️ Construcción del artefacto de predicción ``pipeline_cfc.joblib``.
+
+Ajusta los codificadores categóricos sobre el dataset y entrena la regresión lineal
+con la partición de ``CFC.ipynb`` (80/20, ``random_state=42``), pero no con su
+mismo ajuste: ``Proyecto`` se fija a su valor por defecto (es un identificador, no
+una característica) y los modelos lineales se ajustan sobre columnas estandarizadas
+(Ridge y Lasso penalizan en esa escala) y se devuelven en la escala original, así
+que el artefacto no reproduce el ``modelo_regresion.pkl`` del notebook. Con
+``--desde-modelo`` se reutiliza un regresor ya entrenado en lugar de reentrenar.
+
+Con ``--cv K`` se hace selección de modelo por validación cruzada en K pliegues:
+cada combinación (regresor, hiperparámetros, pliegue) es una tarea independiente
+que se reparte entre un pool de procesos (``--procesos``, por defecto todos los
+núcleos). Gana la combinación con menor RMSE medio, se reentrena con todos los
+datos y se escribe un informe JSON con MAE/RMSE/R² y tiempo de ajuste por pliegue.
+
+Uso::
+
+    python entrenar.py
+    python entrenar.py --desde-modelo modelo_regresion.pkl
+    python entrenar.py --cv 5 --informe metricas_entrenamiento.json
+    python entrenar.py --cv 5 --modelos LinearRegression Ridge --procesos 8
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import Lasso, LinearRegression, Ridge
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import KFold, train_test_split
+
+from datos import ARCHIVO_DATOS, obtener_datos
+from pipeline import ARCHIVO_PIPELINE, PipelinePrediccion, vocabularios_desde_datos
+
+OBJETIVO = "Riesgo de Retraso (%)"
+ARCHIVO_INFORME = "metricas_entrenamiento.json"
+
+# 🔎 Regresores candidatos y su rejilla de hiperparámetros
+CANDIDATOS = {
+    "LinearRegression": (LinearRegression, [{}]),
+    "Ridge": (Ridge, [{"alpha": a} for a in (0.1, 1.0, 10.0, 100.0)]),
+    "Lasso": (Lasso, [{"alpha": a, "max_iter": 10_000} for a in (0.001, 0.01, 0.1, 1.0)]),
+    "RandomForest": (RandomForestRegressor, [
+        {"n_estimators": 200, "max_depth": d, "min_samples_leaf": h, "random_state": 42, "n_jobs": 1}
+        for d in (8, None) for h in (1, 5)
+    ]),
+    "GradientBoosting": (GradientBoostingRegressor, [
+        {"n_estimators": n, "learning_rate": lr, "max_depth": 3, "random_state": 42}
+        for n in (200, 500) for lr in (0.05, 0.1)
+    ]),
+}
+# Se ajustan sobre columnas estandarizadas (ver ``ajustar``)
+LINEALES = ("LinearRegression", "Ridge", "Lasso")
+
+
+def guardar_pipeline(pipeline, destino=ARCHIVO_PIPELINE):
+    """Vuelca el artefacto de forma atómica para que el registro nunca lea un archivo a medias."""
+    temporal = f"{destino}.{os.getpid()}.tmp"
+    joblib.dump(pipeline, temporal)
+    os.replace(temporal, destino)
+
+
+def ajustar(nombre, parametros, X, y):
+    """
+    Ajusta el candidato ``nombre`` con ``parametros``.
+
+    Los lineales se ajustan sobre columnas estandarizadas: sin escalar, el coste
+    (~10⁶ €) desequilibra el sistema y las rejillas de ``alpha`` no significan nada.
+    La escala se deshace después en ``coef_``/``intercept_``, así que el modelo se
+    aplica sobre las columnas originales y ``MotorLineal`` sigue valiendo.
+    """
+    clase, _ = CANDIDATOS[nombre]
+    if nombre not in LINEALES:
+        return clase(**parametros).fit(X, y)
+    valores = np.asarray(X, dtype=float)
+    media = valores.mean(axis=0)
+    escala = valores.std(axis=0)
+    escala[escala == 0] = 1.0  # columnas constantes (p. ej. Proyecto)
+    Z = (valores - media) / escala
+    if isinstance(X, pd.DataFrame):
+        Z = pd.DataFrame(Z, columns=X.columns)
+    modelo = clase(**parametros).fit(Z, y)
+    modelo.coef_ = modelo.coef_ / escala
+    modelo.intercept_ = float(modelo.intercept_ - modelo.coef_ @ media)
+    return modelo
+
+
+def preparar(conjunto):
+    """
+    Vocabularios y matriz ``(X, y)`` codificada a partir de un ``ConjuntoDatos``.
+
+    ``Proyecto`` queda con su valor por defecto en todas las filas, como al predecir
+    (ver ``pipeline.COLUMNAS_IDENTIFICADORAS``): los candidatos no pueden usarlo.
+    """
+    vocabularios = vocabularios_desde_datos(conjunto.df)
+    pipeline = PipelinePrediccion(modelo=None, vocabularios=vocabularios)
+    X = pipeline.codificar(conjunto.df, desconocidas="error")
+    return pipeline, X, conjunto.df[OBJETIVO].to_numpy(dtype=float)
+
+
+def entrenar(conjunto, test_size=0.2, random_state=42):
+    pipeline, X, y = preparar(conjunto)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
+
+    pipeline.modelo = ajustar("LinearRegression", {}, pipeline.como_dataframe(X_train), y_train)
+    y_pred = pipeline.predecir(X_test)
+    metricas = {
+        "MAE": mean_absolute_error(y_test, y_pred),
+        "MSE": mean_squared_error(y_test, y_pred),
+        "R2": r2_score(y_test, y_pred),
+    }
+    pipeline.metadatos.update(metricas=metricas)
+    return pipeline
+
+
+# ⚙️ Validación cruzada en paralelo
+# Cada proceso abre X e y como memmap de un .npy temporal: los datos se leen de la
+# caché de páginas compartida en lugar de copiarse (pickle) en cada tarea.
+_X = _y = _pliegues = None
+
+
+def _iniciar_trabajador(ruta_X, ruta_y, k, semilla):
+    global _X, _y, _pliegues
+    from threadpoolctl import threadpool_limits
+
+    threadpool_limits(1)  # un hilo BLAS por proceso: el paralelismo lo da el pool
+    _X = np.load(ruta_X, mmap_mode="r")
+    _y = np.load(ruta_y, mmap_mode="r")
+    _pliegues = list(KFold(n_splits=k, shuffle=True, random_state=semilla).split(_X))
+
+
+def _ajustar_pliegue(tarea):
+    nombre, parametros, pliegue = tarea
+    entreno, prueba = _pliegues[pliegue]
+    inicio = time.perf_counter()
+    modelo = ajustar(nombre, parametros, _X[entreno], _y[entreno])
+    segundos = time.perf_counter() - inicio
+    y_pred = modelo.predict(_X[prueba])
+    return {
+        "modelo": nombre,
+        "parametros": parametros,
+        "pliegue": pliegue,
+        "MAE": float(mean_absolute_error(_y[prueba], y_pred)),
+        "RMSE": float(np.sqrt(mean_squared_error(_y[prueba], y_pred))),
+        "R2": float(r2_score(_y[prueba], y_pred)),
+        "segundos_ajuste": segundos,
+    }
+
+
+def validar(X, y, modelos=None, k=5, procesos=None, semilla=42):
+    """
+    Evalúa cada combinación de ``CANDIDATOS`` (o solo ``modelos``) en ``k`` pliegues en paralelo.
+
+    Devuelve la lista de resultados por pliegue, en el orden de las tareas.
+    """
+    modelos = list(modelos or CANDIDATOS)
+    desconocidos = set(modelos) - set(CANDIDATOS)
+    if desconocidos:
+        raise ValueError(f"Modelos desconocidos: {sorted(desconocidos)}. Disponibles: {list(CANDIDATOS)}")
+    tareas = [(nombre, parametros, pliegue)
+              for nombre in modelos for parametros in CANDIDATOS[nombre][1] for pliegue in range(k)]
+    procesos = procesos or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory(prefix="cfc-cv-") as directorio:
+        ruta_X, ruta_y = os.path.join(directorio, "X.npy"), os.path.join(directorio, "y.npy")
+        np.save(ruta_X, np.ascontiguousarray(X, dtype=np.float64))
+        np.save(ruta_y, np.ascontiguousarray(y, dtype=np.float64))
+        with ProcessPoolExecutor(max_workers=min(procesos, len(tareas)), initializer=_iniciar_trabajador,
+                                 initargs=(ruta_X, ruta_y, k, semilla)) as pool:
+            return list(pool.map(_ajustar_pliegue, tareas))
+
+
+def resumir(resultados):
+    """Medias por combinación (regresor, hiperparámetros), de mejor a peor RMSE medio."""
+    combinaciones = {}
+    for r in resultados:
+        clave = (r["modelo"], json.dumps(r["parametros"], sort_keys=True))
+        combinaciones.setdefault(clave, []).append(r)
+    resumen = []
+    for (nombre, _), pliegues in combinaciones.items():
+        resumen.append({
+            "modelo": nombre,
+            "parametros": pliegues[0]["parametros"],
+            **{m: float(np.mean([p[m] for p in pliegues])) for m in ("MAE", "RMSE", "R2", "segundos_ajuste")},
+            "RMSE_desv": float(np.std([p["RMSE"] for p in pliegues])),
+        })
+    # sorted es estable: a igual RMSE gana el candidato declarado antes (el más sencillo)
+    return sorted(resumen, key=lambda c: c["RMSE"])
+
+
+def seleccionar(conjunto, modelos=None, k=5, procesos=None, semilla=42):
+    """
+    Selección por validación cruzada: reentrena la mejor combinación con todos los datos.
+
+    Devuelve ``(pipeline, informe)``. El RMSE fuera de pliegue del ganador se guarda
+    también como ``metadatos["sigma_residual"]`` (dispersión del error de predicción).
+    """
+    pipeline, X, y = preparar(conjunto)
+    inicio = time.perf_counter()
+    resultados = validar(X, y, modelos, k, procesos, semilla)
+    segundos_cv = time.perf_counter() - inicio
+    resumen = resumir(resultados)
+    mejor = resumen[0]
+
+    inicio = time.perf_counter()
+    pipeline.modelo = ajustar(mejor["modelo"], mejor["parametros"], pipeline.como_dataframe(X), y)
+    segundos_final = time.perf_counter() - inicio
+
+    metricas = {m: mejor[m] for m in ("MAE", "RMSE", "R2")}
+    pipeline.metadatos.update(metricas=metricas, modelo=mejor["modelo"], parametros=mejor["parametros"],
+                              validacion=f"{k} pliegues", sigma_residual=mejor["RMSE"])
+    informe = {
+        "filas": int(len(y)),
+        "pliegues": k,
+        "procesos": procesos or os.cpu_count(),
+        "segundos_validacion": segundos_cv,
+        "segundos_ajuste_final": segundos_final,
+        "ganador": mejor,
+        "resumen": resumen,
+        "pliegues_detalle": resultados,
+    }
+    return pipeline, informe
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera el artefacto de predicción del riesgo de retraso.")
+    parser.add_argument("--datos", default=ARCHIVO_DATOS)
+    parser.add_argument("--salida", default=ARCHIVO_PIPELINE)
+    parser.add_argument("--desde-modelo", help="Empaquetar este regresor ya entrenado en vez de reentrenar")
+    parser.add_argument("--cv", type=int, default=0, metavar="K",
+                        help="Seleccionar el modelo por validación cruzada en K pliegues")
+    parser.add_argument("--modelos", nargs="+", choices=list(CANDIDATOS), help="Candidatos a evaluar (--cv)")
+    parser.add_argument("--procesos", type=int, help="Procesos del pool (--cv); por defecto, todos los núcleos")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--informe", default=ARCHIVO_INFORME, help="Informe JSON de métricas (--cv)")
+    args = parser.parse_args(argv)
+
+    conjunto = obtener_datos(args.datos)
+    informe = None
+    if args.desde_modelo:
+        pipeline, _, _ = preparar(conjunto)
+        pipeline.modelo = joblib.load(args.desde_modelo)
+        pipeline.metadatos.update(origen=args.desde_modelo)
+    elif args.cv:
+        pipeline, informe = seleccionar(conjunto, args.modelos, args.cv, args.procesos, args.semilla)
+    else:
+        pipeline = entrenar(conjunto)
+
+    pipeline.metadatos.update(
+        datos=os.path.basename(args.datos),
+        version_datos=conjunto.version,
+        sklearn=sklearn.__version__,
+        creado=time.strftime("%Y-%m-%d %H:%M:%S"),
+    )
+    guardar_pipeline(pipeline, args.salida)
+
+    print(f"✅ Artefacto guardado en '{args.salida}'")
+    if informe is not None:
+        informe.update(datos=os.path.basename(args.datos), version_datos=conjunto.version)
+        with open(args.informe, "w", encoding="utf-8") as f:
+            json.dump(informe, f, ensure_ascii=False, indent=2)
+        print(f"🏆 {pipeline.metadatos['modelo']} {pipeline.metadatos['parametros']} "
+              f"({len(informe['pliegues_detalle'])} ajustes en {informe['segundos_validacion']:.1f} s) "
+              f"· informe en '{args.informe}'")
+    for nombre, valor in pipeline.metadatos.get("metricas", {}).items():
+        print(f"   {nombre}: {valor:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+🧭 Superficie de riesgo precalculada para el análisis "what-if".
+
+El modelo se evalúa de una sola vez sobre toda la rejilla de entradas: cada tipo
+de construcción × material × clima del artefacto, cada mes de duración y
+``PUNTOS_COSTO`` costes entre el mínimo y el máximo del dataset. El resultado es
+un tensor ``riesgo[tipo, material, clima, duración, costo]`` que se calcula una vez
+por versión del modelo y de sus vocabularios y se comparte entre sesiones; mover
+un control de la app pasa a ser una consulta al array.
+
+Entre dos puntos de la rejilla de costes se interpola linealmente: con el modelo
+lineal el riesgo es lineal en el coste, así que la consulta coincide con la
+predicción exacta.
+"""
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from prediccion import COLUMNAS_CATEGORICAS, UMBRAL_RIESGO_BAJO, UMBRAL_RIESGO_MODERADO
+
+PUNTOS_COSTO = 200
+# Orden de los ejes del tensor
+EJES = COLUMNAS_CATEGORICAS + ["Duración (meses)", "Costo Total (€)"]
+
+
+@dataclass(frozen=True)
+class SuperficieRiesgo:
+    riesgo: np.ndarray   # (tipos, materiales, climas, duraciones, costes), float32
+    categorias: dict     # columna categórica -> tuple de clases (posición = índice en el tensor)
+    duraciones: np.ndarray
+    costos: np.ndarray
+    version: str
+
+    def _indice(self, columna, valor):
+        return self.categorias[columna].index(valor)
+
+    def _duracion(self, duracion):
+        return int(np.clip(round(duracion) - self.duraciones[0], 0, len(self.duraciones) - 1))
+
+    def _pesos_costo(self, costo):
+        """Índice inferior y peso de interpolación de ``costo`` en la rejilla."""
+        costo = float(np.clip(costo, self.costos[0], self.costos[-1]))
+        k = int(np.clip(np.searchsorted(self.costos, costo, side="right") - 1, 0, len(self.costos) - 2))
+        return k, (costo - self.costos[k]) / (self.costos[k + 1] - self.costos[k])
+
+    def corte(self, tipo, material, clima):
+        """Matriz ``(duraciones, costes)`` de una combinación de categorías."""
+        return self.riesgo[self._indice(EJES[0], tipo), self._indice(EJES[1], material), self._indice(EJES[2], clima)]
+
+    def consultar(self, tipo, material, clima, duracion, costo):
+        """Riesgo estimado (%) de un proyecto, leído de la superficie."""
+        fila = self.corte(tipo, material, clima)[self._duracion(duracion)]
+        k, w = self._pesos_costo(costo)
+        return float(fila[k] * (1 - w) + fila[k + 1] * w)
+
+    def combinaciones(self, duracion, costo):
+        """Riesgo de todas las combinaciones tipo × material × clima para una duración y un coste."""
+        k, w = self._pesos_costo(costo)
+        plano = self.riesgo[:, :, :, self._duracion(duracion)]
+        valores = plano[..., k] * (1 - w) + plano[..., k + 1] * w
+        indice = pd.MultiIndex.from_product([self.categorias[c] for c in EJES[:3]], names=EJES[:3])
+        return pd.Series(valores.ravel(), index=indice, name="Riesgo (%)")
+
+    def fronteras(self, tipo, material, clima, costo, umbrales=(UMBRAL_RIESGO_BAJO, UMBRAL_RIESGO_MODERADO)):
+        """
+        Primera duración (meses) en la que el riesgo alcanza cada umbral para ese coste.
+
+        ``None`` si no se alcanza dentro de la rejilla; la duración mínima si ya se supera.
+        """
+        k, w = self._pesos_costo(costo)
+        matriz = self.corte(tipo, material, clima)
+        curva = matriz[:, k] * (1 - w) + matriz[:, k + 1] * w
+        resultado = {}
+        for umbral in umbrales:
+            cruces = np.flatnonzero(curva >= umbral)
+            resultado[umbral] = int(self.duraciones[cruces[0]]) if len(cruces) else None
+        return resultado
+
+
+def rejilla(agregados, puntos_costo=PUNTOS_COSTO):
+    """Duraciones (cada mes) y costes (``puntos_costo`` valores) entre los extremos del dataset."""
+    duracion_min, duracion_max = agregados.extremos("Duración (meses)")
+    costo_min, costo_max = agregados.extremos("Costo Total (€)")
+    return np.arange(int(duracion_min), int(duracion_max) + 1), np.linspace(costo_min, costo_max, puntos_costo)
+
+
+def calcular_superficie(pipeline, duraciones, costos, version=""):
+    """Evalúa el pipeline sobre toda la rejilla en un único lote vectorizado."""
+    categorias = {col: tuple(pipeline.clases(col)) for col in COLUMNAS_CATEGORICAS}
+    ejes = [np.arange(len(categorias[col]), dtype=float) for col in COLUMNAS_CATEGORICAS]
+    ejes += [np.asarray(duraciones, dtype=float), np.asarray(costos, dtype=float)]
+    forma = tuple(len(eje) for eje in ejes)
+
+    X = np.empty((int(np.prod(forma)), len(pipeline.columnas)))
+    malla = np.meshgrid(*ejes, indexing="ij", copy=False)
+    for j, col in enumerate(pipeline.columnas):
+        X[:, j] = malla[EJES.index(col)].ravel() if col in EJES else pipeline.valores_por_defecto[col]
+    riesgo = pipeline.predecir(X).reshape(forma).astype(np.float32)
+    riesgo.flags.writeable = False
+    return SuperficieRiesgo(riesgo, categorias, np.asarray(duraciones), np.asarray(costos, dtype=float), version)
+
+
+# 📌 Superficies calculadas por (versión del modelo, vocabularios, rejilla); se conservan las más recientes
+MAX_SUPERFICIES = 4
+_superficies = {}
+_bloqueo = threading.Lock()
+
+
+def obtener_superficie(pipeline, version_modelo, agregados, puntos_costo=PUNTOS_COSTO):
+    """
+    Superficie del pipeline para la rejilla del dataset, calculada una vez por versión del modelo.
+
+    La clave incluye los vocabularios del pipeline: si cambian (p. ej. el pipeline se
+    construye al vuelo con un dataset que trae una categoría nueva), los índices del
+    tensor ya no valen aunque la versión del modelo sea la misma.
+    """
+    duraciones, costos = rejilla(agregados, puntos_costo)
+    vocabularios = tuple(tuple(pipeline.clases(col)) for col in COLUMNAS_CATEGORICAS)
+    clave = (version_modelo, vocabularios, int(duraciones[0]), int(duraciones[-1]), float(costos[0]),
+             float(costos[-1]), puntos_costo)
+    with _bloqueo:
+        superficie = _superficies.get(clave)
+        if superficie is None:
+            superficie = calcular_superficie(pipeline, duraciones, costos, version=repr(clave))
+            while len(_superficies) >= MAX_SUPERFICIES:
+                _superficies.pop(next(iter(_superficies)))
+            _superficies[clave] = superficie
+        return superficie
+
+
+def vaciar_cache():
+    with _bloqueo:
+        _superficies.clear()
@@ -0,0 +1,116 @@
+"""
+🏭 Generador reproducible de proyectos sintéticos con el esquema de ``datos_sinteticos.xlsx``.
+
+Las relaciones entre variables imitan las del dataset original: el coste crece con
+la duración y el tipo de obra, la eficiencia depende del clima y del material, y
+el riesgo de retraso sigue la misma forma lineal que aprende el modelo más ruido.
+
+Los datos se generan por bloques de ``BLOQUE`` filas, cada uno con su propia
+semilla derivada de ``--semilla``, así que el resultado es idéntico para una misma
+semilla sea cual sea el formato de salida.
+
+Uso::
+
+    python generador.py --filas 1000000 --salida proyectos_1M.parquet --semilla 0
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+TIPOS = ["Comercial", "Edificio residencial", "Educativo", "Industrial", "Infraestructura", "Residencial",
+         "Restauración", "Sanitario", "Urbano"]
+MATERIALES = ["Acero", "Hormigón", "Ladrillo", "Madera"]
+CLIMAS = ["Húmedo", "Seco", "Templado"]
+
+# Coste mensual medio (€) por tipo de obra
+COSTE_MENSUAL = np.array([73_000, 44_000, 46_000, 88_000, 208_000, 32_000, 24_000, 189_000, 124_000])
+EFECTO_CLIMA = np.array([-4.0, 2.0, 3.0])
+EFECTO_MATERIAL = np.array([2.0, 3.0, -1.0, -3.0])
+
+BLOQUE = 1_000_000
+MAX_FILAS_XLSX = 1_048_575  # límite de filas de una hoja de Excel (sin cabecera)
+FORMATOS = (".csv", ".parquet", ".xlsx")
+
+
+def generar_bloque(filas, rng, inicio=0):
+    tipo = rng.integers(0, len(TIPOS), filas)
+    material = rng.integers(0, len(MATERIALES), filas)
+    clima = rng.integers(0, len(CLIMAS), filas)
+    duracion = rng.integers(10, 33, filas)
+    costo = np.round(duracion * COSTE_MENSUAL[tipo] * rng.lognormal(0.0, 0.25, filas), -4).astype(np.int64)
+    eficiencia = np.clip(np.round(80 + EFECTO_CLIMA[clima] + EFECTO_MATERIAL[material] + rng.normal(0, 4, filas)),
+                         50, 100).astype(np.int64)
+    satisfaccion = np.clip(np.round(rng.normal(4.2, 0.3, filas), 1), 1.0, 5.0)
+    riesgo = (63.6 + 0.254 * duracion - 0.09 * tipo - 0.61 * material - 0.43 * clima - 0.48 * eficiencia
+              - 3.2 * satisfaccion - 1.1e-6 * costo + rng.normal(0, 1.0, filas))
+    return pd.DataFrame({
+        "Proyecto": [f"Proyecto {i:08d}" for i in range(inicio, inicio + filas)],
+        "Tipo de Construcción": np.asarray(TIPOS, dtype=object)[tipo],
+        "Duración (meses)": duracion,
+        "Costo Total (€)": costo,
+        "Material Principal": np.asarray(MATERIALES, dtype=object)[material],
+        "Clima Predominante": np.asarray(CLIMAS, dtype=object)[clima],
+        "Riesgo de Retraso (%)": np.clip(np.round(riesgo), 0, 100).astype(np.int64),
+        "Eficiencia (%)": eficiencia,
+        "Satisfacción Cliente (1-5)": satisfaccion,
+    })
+
+
+def generar_bloques(filas, semilla=0):
+    """Itera sobre DataFrames de como mucho ``BLOQUE`` filas."""
+    semillas = np.random.SeedSequence(semilla).spawn(-(-filas // BLOQUE))
+    for k, semilla_bloque in enumerate(semillas):
+        inicio = k * BLOQUE
+        yield generar_bloque(min(BLOQUE, filas - inicio), np.random.default_rng(semilla_bloque), inicio)
+
+
+def generar_df(filas, semilla=0):
+    """Dataset completo en memoria."""
+    return pd.concat(generar_bloques(filas, semilla), ignore_index=True)
+
+
+def escribir(destino, filas, semilla=0):
+    """Escribe ``filas`` proyectos en CSV, Parquet o XLSX sin tenerlos todos en memoria (salvo XLSX)."""
+    extension = os.path.splitext(destino)[1].lower()
+    if extension not in FORMATOS:
+        raise ValueError(f"Formato no soportado: '{destino}'. Use CSV, Parquet o XLSX.")
+
+    if extension == ".xlsx":
+        if filas > MAX_FILAS_XLSX:
+            raise ValueError(f"Una hoja de Excel admite como mucho {MAX_FILAS_XLSX:,} filas; use CSV o Parquet.")
+        generar_df(filas, semilla).to_excel(destino, index=False)
+    elif extension == ".csv":
+        for k, bloque in enumerate(generar_bloques(filas, semilla)):
+            bloque.to_csv(destino, mode="w" if k == 0 else "a", header=k == 0, index=False)
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        escritor = None
+        try:
+            for bloque in generar_bloques(filas, semilla):
+                tabla = pa.Table.from_pandas(bloque, preserve_index=False)
+                if escritor is None:
+                    escritor = pq.ParquetWriter(destino, tabla.schema)
+                escritor.write_table(tabla)
+        finally:
+            if escritor is not None:
+                escritor.close()
+    return destino
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera proyectos sintéticos con el esquema del dataset.")
+    parser.add_argument("--filas", type=int, required=True)
+    parser.add_argument("--salida", required=True, help="Archivo .csv, .parquet o .xlsx")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    escribir(args.salida, args.filas, args.semilla)
+    print(f"✅ {args.filas:,} proyectos escritos en '{args.salida}'")
+
+
+if __name__ == "__main__":
+    main()
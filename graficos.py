@@ -0,0 +1,312 @@
+"""
+📊 Figuras del dashboard con caché de imágenes renderizadas.
+
+Cada figura se dibuja una sola vez por versión del dataset y parámetros, se
+convierte a PNG y se guarda en una caché LRU de proceso acotada en bytes. Las
+figuras se crean con ``matplotlib.figure.Figure`` (no con ``pyplot``), de modo que
+no quedan registradas en el estado global de matplotlib ni se acumulan en memoria.
+
+Por encima de ``UMBRAL_DATOS_GRANDES`` filas las figuras no pasan los puntos en bruto
+a seaborn: histogramas, KDE, cajas y banda de regresión se calculan en NumPy y solo
+se dibujan esos arrays pequeños (la dispersión se sustituye por un mapa de densidad).
+
+matplotlib y seaborn se importan solo al dibujar: servir una figura ya cacheada no
+los carga.
+"""
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from instrumentacion import tramo
+from prediccion import UMBRAL_RIESGO_BAJO, UMBRAL_RIESGO_MODERADO
+
+TAMANO_FIGURA = (12, 6)
+LIMITE_CACHE_MB = float(os.environ.get("CFC_CACHE_FIGURAS_MB", 64))
+UMBRAL_DATOS_GRANDES = int(os.environ.get("CFC_UMBRAL_GRAFICOS", 50_000))
+
+
+class CacheFiguras:
+    """Caché LRU de imágenes PNG limitada por el total de bytes almacenados."""
+
+    def __init__(self, limite_bytes):
+        self.limite_bytes = limite_bytes
+        self._imagenes = OrderedDict()
+        self._bytes = 0
+        self._bloqueo = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave, dibujar):
+        """Devuelve los bytes PNG de ``clave``; si no están, llama a ``dibujar()`` y los guarda."""
+        with self._bloqueo:
+            imagen = self._imagenes.get(clave)
+            if imagen is not None:
+                self._imagenes.move_to_end(clave)
+                self.aciertos += 1
+                return imagen
+            self.fallos += 1
+
+        with tramo("dibujar"):
+            fig = dibujar()
+        with tramo("png"):
+            imagen = a_png(fig)
+
+        with self._bloqueo:
+            if clave not in self._imagenes:
+                self._imagenes[clave] = imagen
+                self._bytes += len(imagen)
+            while self._bytes > self.limite_bytes and len(self._imagenes) > 1:
+                _, expulsada = self._imagenes.popitem(last=False)
+                self._bytes -= len(expulsada)
+        return imagen
+
+    def estadisticas(self):
+        with self._bloqueo:
+            return {"figuras": len(self._imagenes), "bytes": self._bytes,
+                    "aciertos": self.aciertos, "fallos": self.fallos}
+
+    def vaciar(self):
+        with self._bloqueo:
+            self._imagenes.clear()
+            self._bytes = 0
+
+
+# 📌 Caché compartida por todas las sesiones del proceso
+cache_figuras = CacheFiguras(int(LIMITE_CACHE_MB * 1024 * 1024))
+
+
+def a_png(fig):
+    """Serializa la figura igual que ``st.pyplot`` (PNG con ``bbox_inches="tight"``) y la libera."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight")
+    fig.clear()
+    return buffer.getvalue()
+
+
+def figura_png(nombre, version, dibujar, **parametros):
+    """
+    PNG de la figura ``nombre`` para una versión del dataset.
+
+    ``dibujar`` solo se invoca si la combinación ``(nombre, version, parametros)`` no
+    está en la caché; los ``parametros`` forman parte de la clave.
+    """
+    clave = (nombre, version, tuple(sorted(parametros.items())))
+    return cache_figuras.obtener(clave, dibujar)
+
+
+def version_de(df):
+    """Huella del contenido de un DataFrame pequeño (tablas fijas de la aplicación)."""
+    return hashlib.sha1(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()).hexdigest()
+
+
+def _nueva_figura():
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=TAMANO_FIGURA)
+    return fig, fig.subplots()
+
+
+def _titulos(ax, xlabel, ylabel, titulo):
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.set_title(titulo, fontsize=14, fontweight="bold")
+
+
+# 📐 Modo de datos grandes: estadísticos vectorizados en NumPy y solo arrays pequeños al dibujar
+
+def es_grande(df):
+    """A partir de ``CFC_UMBRAL_GRAFICOS`` filas las figuras se dibujan desde datos preagregados."""
+    return len(df) > UMBRAL_DATOS_GRANDES
+
+
+def kde_en_rejilla(valores, rejilla, puntos_binning=2048):
+    """
+    KDE gaussiana evaluada en ``rejilla`` mediante binning lineal y convolución.
+
+    Usa el ancho de banda de Scott (el de ``scipy.stats.gaussian_kde`` y seaborn) y
+    devuelve una densidad; el coste es O(n) para el binning más O(puntos_binning).
+    """
+    valores = valores[np.isfinite(valores)]
+    n = len(valores)
+    if n < 2 or np.ptp(valores) == 0:
+        return np.zeros_like(rejilla, dtype=float)
+    ancho = valores.std(ddof=1) * n ** (-1 / 5)
+    lo, hi = min(rejilla[0], valores.min()) - 3 * ancho, max(rejilla[-1], valores.max()) + 3 * ancho
+    conteos, bordes = np.histogram(valores, bins=puntos_binning, range=(lo, hi))
+    paso = bordes[1] - bordes[0]
+    mitad = int(np.ceil(4 * ancho / paso))
+    desplazamientos = np.arange(-mitad, mitad + 1) * paso
+    nucleo = np.exp(-0.5 * (desplazamientos / ancho) ** 2) / (ancho * np.sqrt(2 * np.pi))
+    densidad = np.convolve(conteos, nucleo, mode="same") / n
+    centros = (bordes[:-1] + bordes[1:]) / 2
+    return np.interp(rejilla, centros, densidad)
+
+
+def resumen_caja(valores_ordenados, cuartiles=None):
+    """
+    Estadísticos de ``Axes.bxp`` (cuartiles y bigotes a 1,5·IQR) desde valores ya ordenados.
+
+    ``cuartiles`` (Q1, mediana, Q3) sustituye a los calculados sobre ``valores_ordenados``
+    cuando estos son solo representativos (p. ej. los centroides de un ``agregados.Boceto``).
+    """
+    v = valores_ordenados
+    q1, mediana, q3 = np.quantile(v, [0.25, 0.5, 0.75]) if cuartiles is None else cuartiles
+    iqr = q3 - q1
+    # Bigotes: valor real más extremo dentro de 1,5·IQR (búsqueda binaria sobre el array ordenado)
+    bigote_inf = v[np.searchsorted(v, q1 - 1.5 * iqr, side="left")]
+    bigote_sup = v[np.searchsorted(v, q3 + 1.5 * iqr, side="right") - 1]
+    return {"med": mediana, "q1": q1, "q3": q3, "whislo": bigote_inf, "whishi": bigote_sup, "fliers": []}
+
+
+def banda_regresion(x, y, rejilla, z=1.96):
+    """Recta de mínimos cuadrados y banda de confianza al 95 % de la media, en forma cerrada."""
+    n = len(x)
+    x_media, y_media = x.mean(), y.mean()
+    sxx = ((x - x_media) ** 2).sum()
+    pendiente = ((x - x_media) * (y - y_media)).sum() / sxx
+    ordenada = y_media - pendiente * x_media
+    residuos = y - (ordenada + pendiente * x)
+    s = np.sqrt((residuos ** 2).sum() / (n - 2))
+    ajuste = ordenada + pendiente * rejilla
+    margen = z * s * np.sqrt(1 / n + (rejilla - x_media) ** 2 / sxx)
+    return ajuste, ajuste - margen, ajuste + margen
+
+
+def _histograma_agregado(ax, valores, bins, color):
+    conteos, bordes = np.histogram(valores, bins=bins)
+    ax.bar(bordes[:-1], conteos, width=np.diff(bordes), align="edge", color=color, alpha=0.75, edgecolor="white")
+    rejilla = np.linspace(bordes[0], bordes[-1], 200)
+    ax.plot(rejilla, kde_en_rejilla(valores, rejilla) * len(valores) * (bordes[1] - bordes[0]), color=color)
+
+
+def _dispersion_agregada(ax, x, y, color, celdas=60):
+    """Mapa de densidad 2D en vez de un punto por proyecto, más la recta con su banda."""
+    # Con valores enteros (meses) una celda por valor evita franjas vacías entre columnas
+    enteros = np.ptp(x) <= 4 * celdas and np.array_equal(x, np.round(x))
+    bins_x = np.arange(x.min() - 0.5, x.max() + 1.5) if enteros else celdas
+    conteos, bordes_x, bordes_y = np.histogram2d(x, y, bins=[bins_x, celdas])
+    conteos = np.ma.masked_equal(conteos.T, 0)
+    ax.pcolormesh(bordes_x, bordes_y, conteos, cmap="Oranges", shading="flat")
+    rejilla = np.linspace(bordes_x[0], bordes_x[-1], 100)
+    ajuste, inferior, superior = banda_regresion(x, y, rejilla)
+    ax.plot(rejilla, ajuste, color=color)
+    ax.fill_between(rejilla, inferior, superior, color=color, alpha=0.15)
+
+
+def _cajas_agregadas(ax, df, x, y, agregados=None):
+    import seaborn as sns
+
+    if agregados is not None and y in agregados.metricas:
+        categorias = agregados.categorias(x)
+        bocetos = [agregados.boceto(y, c, dimension=x) for c in categorias]
+        resumenes = [(b.valores(), b.cuantiles([0.25, 0.5, 0.75])) for b in bocetos]
+    else:
+        codigos, categorias = pd.factorize(df[x], sort=True)
+        valores = df[y].to_numpy(dtype=float)
+        resumenes = [(np.sort(valores[codigos == k]), None) for k in range(len(categorias))]
+    estadisticos = [dict(resumen_caja(v, cuartiles), label=c)
+                    for c, (v, cuartiles) in zip(categorias, resumenes) if len(v)]
+    cajas = ax.bxp(estadisticos, patch_artist=True, showfliers=False)
+    for caja, color in zip(cajas["boxes"], sns.color_palette("coolwarm", len(estadisticos))):
+        caja.set_facecolor(color)
+
+
+# 📊 Figuras de "Presentación y Datos"
+
+def distribucion_costos(df):
+    import seaborn as sns
+
+    fig, ax = _nueva_figura()
+    if es_grande(df):
+        _histograma_agregado(ax, df["Costo Total (€)"].to_numpy(dtype=float), bins=15, color='#4CAF50')
+    else:
+        sns.histplot(df["Costo Total (€)"], bins=15, kde=True, color='#4CAF50', ax=ax)
+    _titulos(ax, "Costo Total (€)", "Frecuencia", "Análisis de Costos en Construcción")
+    return fig
+
+
+def duracion_vs_costo(df):
+    import seaborn as sns
+
+    fig, ax = _nueva_figura()
+    if es_grande(df):
+        _dispersion_agregada(ax, df["Duración (meses)"].to_numpy(dtype=float),
+                             df["Costo Total (€)"].to_numpy(dtype=float), color='#FF9800')
+    else:
+        sns.regplot(x=df["Duración (meses)"], y=df["Costo Total (€)"], color='#FF9800', scatter_kws={'s': 70}, ax=ax)
+    _titulos(ax, "Duración del Proyecto (meses)", "Costo Total (€)", "Relación entre Duración y Costos")
+    return fig
+
+
+def _caja(df, x, y, xlabel, ylabel, titulo, agregados=None):
+    import seaborn as sns
+
+    fig, ax = _nueva_figura()
+    if es_grande(df):
+        _cajas_agregadas(ax, df, x, y, agregados)
+    else:
+        sns.boxplot(x=df[x], y=df[y], palette="coolwarm", ax=ax)
+    _titulos(ax, xlabel, ylabel, titulo)
+    return fig
+
+
+def eficiencia_por_material(df, agregados=None):
+    return _caja(df, "Material Principal", "Eficiencia (%)", "Material Principal", "Eficiencia (%)",
+                 "Impacto del Material en la Eficiencia de Construcción", agregados)
+
+
+def satisfaccion_por_tipo(df, agregados=None):
+    return _caja(df, "Tipo de Construcción", "Satisfacción Cliente (1-5)", "Tipo de Construcción",
+                 "Satisfacción Promedio (1-5)", "Nivel de Satisfacción por Tipo de Construcción", agregados)
+
+
+def rentabilidad_por_tipo(medias):
+    """``medias``: rentabilidad media indexada por tipo (ver ``AlmacenAgregados.medias``)."""
+    import seaborn as sns
+
+    rentabilidad = medias.rename_axis("Tipo de Construcción").rename("Rentabilidad (%)").reset_index()
+    fig, ax = _nueva_figura()
+    sns.barplot(x="Tipo de Construcción", y="Rentabilidad (%)", data=rentabilidad, palette="viridis", ax=ax)
+    _titulos(ax, "Tipo de Construcción", "Rentabilidad (%)", "Rentabilidad Promedio por Tipo de Construcción")
+    return fig
+
+
+def eficiencia_por_clima(df, agregados=None):
+    return _caja(df, "Clima Predominante", "Eficiencia (%)", "Clima", "Eficiencia (%)",
+                 "Impacto del Clima en la Eficiencia de Construcción", agregados)
+
+
+# 🧭 Figuras de "Modelo Predictivo"
+
+# Escala de color común a todas las combinaciones para que los mapas sean comparables
+ESCALA_RIESGO_MAX = 1.5 * UMBRAL_RIESGO_MODERADO
+
+def superficie_riesgo(superficie, tipo, material, clima):
+    """Mapa de calor del riesgo por duración y coste, con las fronteras del 10 % y el 20 %."""
+    matriz = superficie.corte(tipo, material, clima)
+    fig, ax = _nueva_figura()
+    malla = ax.pcolormesh(superficie.duraciones, superficie.costos, matriz.T, cmap="RdYlGn_r", shading="nearest",
+                          vmin=0, vmax=ESCALA_RIESGO_MAX)
+    fig.colorbar(malla, ax=ax, label="Riesgo de Retraso (%)")
+    if matriz.min() < UMBRAL_RIESGO_MODERADO and matriz.max() > UMBRAL_RIESGO_BAJO:
+        fronteras = ax.contour(superficie.duraciones, superficie.costos, matriz.T,
+                               levels=[UMBRAL_RIESGO_BAJO, UMBRAL_RIESGO_MODERADO], colors="black", linewidths=1.5)
+        ax.clabel(fronteras, fmt="%d %%")
+    _titulos(ax, "Duración de la obra (meses)", "Costo Total (€)", f"Mapa de Riesgo · {tipo} · {material} · {clima}")
+    return fig
+
+
+# 📊 Figuras de "Conclusiones y Perfil" (datos fijos)
+
+def barras_horizontales(datos, x, y, palette, titulo, xlabel):
+    import seaborn as sns
+
+    fig, ax = _nueva_figura()
+    sns.barplot(x=x, y=y, data=datos, palette=palette, ax=ax)
+    _titulos(ax, xlabel, "", titulo)
+    return fig
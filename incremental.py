@@ -0,0 +1,219 @@
+"""
+🔁 Actualización incremental del modelo de riesgo con proyectos nuevos.
+
+La regresión lineal por mínimos cuadrados queda determinada por sus estadísticos
+suficientes ``XᵀX``, ``Xᵀy`` e ``yᵀy`` (con una columna de unos para el intercepto).
+Se guardan en ``estado_incremental.joblib``; cada archivo nuevo solo suma su
+contribución, bloque a bloque, y el modelo se vuelve a resolver con un sistema de
+9×9. El coste de una actualización depende de las filas nuevas, no del histórico,
+y el resultado es idéntico a reentrenar con todos los datos juntos.
+
+Las categorías nuevas de tipo, material o clima se añaden al final de cada
+vocabulario, así que los códigos ya usados no cambian. ``Proyecto`` es un
+identificador: los proyectos nuevos reciben el valor por defecto, igual que al
+predecir.
+
+Tras cada actualización se publica una versión nueva de ``pipeline_cfc.joblib``,
+que el registro de modelos recarga y la página *Modelo Predictivo* usa en el
+siguiente rerun.
+
+Uso::
+
+    python incremental.py proyectos_nuevos/                # todos los CSV/Excel/Parquet aún no procesados
+    python incremental.py cierre_2024_06.csv --tam-bloque 200000
+
+La primera ejecución crea el estado a partir de ``datos_sinteticos.xlsx`` (``--datos``).
+"""
+import argparse
+import os
+import time
+from dataclasses import dataclass, field
+
+import joblib
+import numpy as np
+import sklearn
+from sklearn.linear_model import LinearRegression
+
+from datos import ARCHIVO_DATOS, huella_archivo, obtener_datos
+from entrenar import OBJETIVO, guardar_pipeline
+from lotes import FORMATOS, TAM_BLOQUE, leer_por_bloques
+from pipeline import ARCHIVO_PIPELINE, COLUMNAS_IDENTIFICADORAS, PipelinePrediccion, vocabularios_desde_datos
+from prediccion import COLUMNAS_MODELO
+
+ARCHIVO_ESTADO = "estado_incremental.joblib"
+
+
+@dataclass
+class EstadoIncremental:
+    """Estadísticos suficientes de la regresión, vocabularios y archivos ya incorporados."""
+    vocabularios: dict
+    columnas: list
+    xtx: np.ndarray = None
+    xty: np.ndarray = None
+    yty: float = 0.0
+    n: int = 0
+    version: int = 0
+    procesados: dict = field(default_factory=dict)  # huella del archivo -> {"archivo", "filas", "fecha"}
+
+    def __post_init__(self):
+        for col in COLUMNAS_IDENTIFICADORAS:
+            self.vocabularios.pop(col, None)
+        d = len(self.columnas) + 1
+        if self.xtx is None:
+            self.xtx = np.zeros((d, d))
+            self.xty = np.zeros(d)
+
+    def pipeline(self, **metadatos):
+        """``PipelinePrediccion`` con los vocabularios actuales (sin regresor)."""
+        return PipelinePrediccion(modelo=None, vocabularios={c: list(v) for c, v in self.vocabularios.items()},
+                                  columnas=list(self.columnas), metadatos=metadatos)
+
+    def acumular(self, X, y):
+        """Suma la contribución de un bloque ya codificado; descarta filas incompletas."""
+        validas = ~(np.isnan(X).any(axis=1) | np.isnan(y))
+        X, y = X[validas], y[validas]
+        A = np.column_stack([np.ones(len(X)), X])
+        self.xtx += A.T @ A
+        self.xty += A.T @ y
+        self.yty += float(y @ y)
+        self.n += len(y)
+        return len(y)
+
+    def resolver(self):
+        """``(coeficientes, intercepto, sigma_residual)`` de mínimos cuadrados."""
+        # Escalado por la diagonal: el coste (~10⁶ €) y la columna de unos difieren en muchos órdenes
+        escala = np.sqrt(np.diag(self.xtx))
+        escala[escala == 0] = 1.0
+        A = self.xtx / np.outer(escala, escala)
+        b = self.xty / escala
+        beta = np.linalg.lstsq(A, b, rcond=None)[0] / escala
+        residuo = self.yty - 2 * beta @ self.xty + beta @ self.xtx @ beta
+        grados = max(self.n - len(beta), 1)
+        return beta[1:], float(beta[0]), float(np.sqrt(max(residuo, 0.0) / grados))
+
+    def modelo(self):
+        """``LinearRegression`` equivalente a ajustar con todas las filas acumuladas."""
+        coeficientes, intercepto, _ = self.resolver()
+        modelo = LinearRegression()
+        modelo.coef_ = coeficientes
+        modelo.intercept_ = intercepto
+        modelo.n_features_in_ = len(self.columnas)
+        modelo.feature_names_in_ = np.array(self.columnas, dtype=object)
+        return modelo
+
+
+def guardar_estado(estado, destino=ARCHIVO_ESTADO):
+    temporal = f"{destino}.{os.getpid()}.tmp"
+    # Se guarda como diccionario para no depender de dónde esté definida la clase (``__main__`` en la CLI)
+    joblib.dump(vars(estado), temporal)
+    os.replace(temporal, destino)
+
+
+def cargar_estado(ruta=ARCHIVO_ESTADO, archivo_datos=ARCHIVO_DATOS, tam_bloque=TAM_BLOQUE):
+    """Lee el estado guardado o, si no existe, lo crea con una pasada sobre el dataset histórico."""
+    if os.path.exists(ruta):
+        return EstadoIncremental(**joblib.load(ruta))
+    conjunto = obtener_datos(archivo_datos)
+    estado = EstadoIncremental(vocabularios_desde_datos(conjunto.df), list(COLUMNAS_MODELO))
+    pipeline = estado.pipeline()
+    for inicio in range(0, len(conjunto.df), tam_bloque):
+        bloque = conjunto.df.iloc[inicio:inicio + tam_bloque]
+        estado.acumular(pipeline.codificar(bloque, desconocidas="error"), bloque[OBJETIVO].to_numpy(dtype=float))
+    estado.procesados[conjunto.version] = {"archivo": os.path.basename(archivo_datos), "filas": len(conjunto.df),
+                                           "fecha": time.strftime("%Y-%m-%d %H:%M:%S")}
+    return estado
+
+
+def archivos_pendientes(origen, estado):
+    """``[(ruta, huella)]`` de los archivos de ``origen`` (archivo o carpeta) aún no incorporados."""
+    if os.path.isdir(origen):
+        rutas = [os.path.join(origen, f) for f in sorted(os.listdir(origen))
+                 if os.path.splitext(f)[1].lower() in FORMATOS]
+    else:
+        rutas = [origen]
+    pendientes = []
+    for ruta in rutas:
+        huella = huella_archivo(ruta)
+        if huella not in estado.procesados:
+            pendientes.append((ruta, huella))
+    return pendientes
+
+
+def incorporar(estado, ruta, tam_bloque=TAM_BLOQUE):
+    """
+    Acumula un archivo de proyectos bloque a bloque.
+
+    Devuelve ``(filas usadas, {columna: categorías nuevas})``.
+    """
+    pipeline = estado.pipeline()
+    filas, nuevas = 0, {}
+    for bloque in leer_por_bloques(ruta, tam_bloque):
+        if OBJETIVO not in bloque:
+            raise ValueError(f"'{ruta}' no tiene la columna objetivo '{OBJETIVO}'")
+        for col, valores in pipeline.extender_vocabularios(bloque).items():
+            nuevas.setdefault(col, []).extend(valores)
+        filas += estado.acumular(pipeline.codificar(bloque, desconocidas="nan"), bloque[OBJETIVO].to_numpy(dtype=float))
+    estado.vocabularios = pipeline.vocabularios
+    return filas, nuevas
+
+
+def publicar(estado, destino=ARCHIVO_PIPELINE):
+    """Resuelve el modelo y guarda el artefacto de predicción de la versión actual del estado."""
+    _, _, sigma = estado.resolver()
+    pipeline = estado.pipeline(
+        origen="incremental",
+        version_incremental=estado.version,
+        filas_entrenamiento=estado.n,
+        sigma_residual=sigma,
+        sklearn=sklearn.__version__,
+        creado=time.strftime("%Y-%m-%d %H:%M:%S"),
+    )
+    pipeline.modelo = estado.modelo()
+    guardar_pipeline(pipeline, destino)
+    return pipeline
+
+
+def actualizar(origen, ruta_estado=ARCHIVO_ESTADO, salida=ARCHIVO_PIPELINE, archivo_datos=ARCHIVO_DATOS,
+               tam_bloque=TAM_BLOQUE):
+    """Incorpora los archivos pendientes de ``origen`` y publica el modelo si ha cambiado algo."""
+    estado = cargar_estado(ruta_estado, archivo_datos, tam_bloque)
+    incorporados = []
+    for ruta, huella in archivos_pendientes(origen, estado):
+        filas, nuevas = incorporar(estado, ruta, tam_bloque)
+        estado.procesados[huella] = {"archivo": os.path.basename(ruta), "filas": filas,
+                                     "fecha": time.strftime("%Y-%m-%d %H:%M:%S")}
+        incorporados.append((ruta, filas, nuevas))
+    if not incorporados and os.path.exists(ruta_estado):
+        return estado, incorporados
+    # El estado se guarda antes que el artefacto: si algo falla después, un archivo
+    # nunca queda contado dos veces y basta con volver a lanzar la actualización
+    estado.version += 1
+    guardar_estado(estado, ruta_estado)
+    publicar(estado, salida)
+    return estado, incorporados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Actualiza el modelo de riesgo con proyectos nuevos.")
+    parser.add_argument("origen", help="Archivo o carpeta con proyectos terminados (CSV, Excel o Parquet)")
+    parser.add_argument("--estado", default=ARCHIVO_ESTADO)
+    parser.add_argument("--salida", default=ARCHIVO_PIPELINE)
+    parser.add_argument("--datos", default=ARCHIVO_DATOS, help="Dataset histórico para crear el estado inicial")
+    parser.add_argument("--tam-bloque", type=int, default=TAM_BLOQUE)
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    estado, incorporados = actualizar(args.origen, args.estado, args.salida, args.datos, args.tam_bloque)
+    if not incorporados:
+        print("ℹ️ No hay archivos nuevos que incorporar.")
+        return
+    for ruta, filas, nuevas in incorporados:
+        print(f"➕ {os.path.basename(ruta)}: {filas:,} proyectos")
+        for col, valores in nuevas.items():
+            print(f"   categorías nuevas en '{col}': {', '.join(map(str, valores))}")
+    print(f"✅ Versión {estado.version} publicada en '{args.salida}' ({estado.n:,} proyectos, "
+          f"{time.perf_counter() - inicio:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+🗞️ Informes estáticos de "Presentación y Datos".
+
+Genera, sin Streamlit, un informe HTML autocontenido (figuras PNG incrustadas)
+por dataset con los mismos KPIs, figuras y tabla de benchmarking que la página,
+calculados con el mismo código (``datos``, ``agregados``, ``graficos``). Los
+datasets se reparten entre procesos y un manifiesto en la carpeta de salida
+guarda la huella SHA-256 de cada entrada: si no ha cambiado (ni la versión del
+informe), no se vuelve a generar.
+
+Uso::
+
+    python informes.py datos_sinteticos.xlsx carteras/ --salida informes/ --procesos 4
+    python informes.py --portafolios --png        # todas las carteras registradas, con PNG sueltos
+"""
+import argparse
+import base64
+import hashlib
+import html
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import graficos
+from agregados import KPIS, obtener_agregados, tabla_competencia
+from datos import huella_archivo, obtener_datos
+
+# Cambiarla invalida todos los informes del manifiesto (p. ej. al modificar la plantilla)
+VERSION_INFORME = 1
+ARCHIVO_MANIFIESTO = "manifiesto.json"
+EXTENSIONES = (".xlsx", ".xls", ".csv", ".parquet")
+
+# (nombre, título, dibujar(df, agregados)) en el orden de la página
+FIGURAS = [
+    ("distribucion_costos", "Distribución de Costos en Construcción",
+     lambda df, agregados: graficos.distribucion_costos(df)),
+    ("duracion_vs_costo", "Impacto de la Duración en Costos Totales",
+     lambda df, agregados: graficos.duracion_vs_costo(df)),
+    ("eficiencia_por_material", "Eficiencia en Construcción según Materiales Utilizados",
+     graficos.eficiencia_por_material),
+    ("satisfaccion_por_tipo", "Evaluación de Satisfacción en los Proyectos", graficos.satisfaccion_por_tipo),
+    ("rentabilidad_por_tipo", "Rentabilidad Comparativa en Construcción",
+     lambda df, agregados: graficos.rentabilidad_por_tipo(agregados.medias("Rentabilidad (%)", "Tipo de Construcción"))),
+    ("eficiencia_por_clima", "Cómo el Clima y la Ubicación Afectan la Construcción", graficos.eficiencia_por_clima),
+]
+
+
+_PLANTILLA = """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<title>{titulo}</title>
+<style>
+body {{ font-family: sans-serif; max-width: 1100px; margin: 2em auto; color: #222; }}
+.kpis {{ display: flex; gap: 2em; }}
+.kpi {{ flex: 1; padding: 1em; border: 1px solid #ddd; border-radius: 6px; }}
+.kpi .valor {{ font-size: 1.8em; font-weight: bold; }}
+img {{ max-width: 100%; }}
+table {{ border-collapse: collapse; }}
+th, td {{ padding: 0.4em 0.8em; border-bottom: 1px solid #ddd; text-align: right; }}
+footer {{ margin-top: 3em; color: #888; font-size: 0.85em; }}
+</style>
+</head>
+<body>
+<h1>{titulo}</h1>
+<p>{proyectos:,} proyectos · dataset <code>{origen}</code></p>
+<h2>Indicadores Estratégicos de Construcción</h2>
+<div class="kpis">{kpis}</div>
+{figuras}
+<h2>Comparación de Desempeño con Empresas del Sector</h2>
+{tabla}
+<footer>Generado el {fecha} · versión de los datos {version}</footer>
+</body>
+</html>
+"""
+
+
+def huella_informe(ruta, png=False):
+    """Huella de la entrada que determina el informe: contenido del dataset, versión y opciones."""
+    clave = f"{VERSION_INFORME}|{int(png)}|{graficos.UMBRAL_DATOS_GRANDES}|{huella_archivo(ruta)}"
+    return hashlib.sha256(clave.encode()).hexdigest()
+
+
+def generar_informe(nombre, ruta, directorio, png=False):
+    """Escribe ``<nombre>.html`` (y ``<nombre>/*.png`` si ``png``); devuelve los archivos generados."""
+    conjunto = obtener_datos(ruta)
+    df, agregados = conjunto.df, obtener_agregados(conjunto)
+
+    kpis = "".join(f'<div class="kpi">{html.escape(etiqueta)}<div class="valor">'
+                   f'{formato.format(agregados.media(metrica))}</div></div>'
+                   for etiqueta, metrica, formato in KPIS)
+    archivos, secciones = [], []
+    for figura, titulo, dibujar in FIGURAS:
+        imagen = graficos.a_png(dibujar(df, agregados))
+        if png:
+            destino = os.path.join(directorio, nombre, f"{figura}.png")
+            os.makedirs(os.path.dirname(destino), exist_ok=True)
+            with open(destino, "wb") as f:
+                f.write(imagen)
+            archivos.append(os.path.relpath(destino, directorio))
+        secciones.append(f"<h2>{html.escape(titulo)}</h2>\n"
+                         f'<img alt="{figura}" src="data:image/png;base64,{base64.b64encode(imagen).decode()}">')
+
+    documento = _PLANTILLA.format(
+        titulo=html.escape(f"Análisis de Datos en Construcción · {nombre}"),
+        proyectos=len(df), origen=html.escape(os.path.basename(ruta)), kpis=kpis, figuras="\n".join(secciones),
+        tabla=tabla_competencia(agregados).to_html(index=False, border=0, float_format="{:,.1f}".format,
+                                                    formatters={"Costo Promedio (€)": "{:,.0f}".format}),
+        fecha=datetime.now().strftime("%Y-%m-%d %H:%M"), version=conjunto.version[:12],
+    )
+    destino = os.path.join(directorio, f"{nombre}.html")
+    temporal = f"{destino}.{os.getpid()}.tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        f.write(documento)
+    os.replace(temporal, destino)
+    return [os.path.relpath(destino, directorio)] + archivos
+
+
+def _generar(argumentos):
+    nombre, ruta, directorio, png, huella = argumentos
+    inicio = time.perf_counter()
+    archivos = generar_informe(nombre, ruta, directorio, png)
+    return nombre, {"origen": ruta, "huella": huella, "archivos": archivos,
+                    "segundos": round(time.perf_counter() - inicio, 3)}
+
+
+def cargar_manifiesto(directorio):
+    ruta = os.path.join(directorio, ARCHIVO_MANIFIESTO)
+    if not os.path.exists(ruta):
+        return {}
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def guardar_manifiesto(directorio, manifiesto):
+    ruta = os.path.join(directorio, ARCHIVO_MANIFIESTO)
+    with open(f"{ruta}.tmp", "w", encoding="utf-8") as f:
+        json.dump(manifiesto, f, ensure_ascii=False, indent=2)
+    os.replace(f"{ruta}.tmp", ruta)
+
+
+def _vigente(entrada, huella, directorio):
+    return (entrada is not None and entrada["huella"] == huella
+            and all(os.path.exists(os.path.join(directorio, a)) for a in entrada["archivos"]))
+
+
+def _ejecutar(tareas, procesos):
+    """Devuelve ``(nombre, entrada del manifiesto, error)`` de cada tarea a medida que termina."""
+    if procesos <= 1:
+        for tarea in tareas:
+            try:
+                yield tarea[0], _generar(tarea)[1], None
+            except Exception as e:
+                yield tarea[0], None, e
+        return
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = {pool.submit(_generar, tarea): tarea[0] for tarea in tareas}
+        for futuro in as_completed(futuros):
+            error = futuro.exception()
+            yield futuros[futuro], None if error else futuro.result()[1], error
+
+
+def generar_informes(datasets, directorio, procesos=None, png=False, forzar=False):
+    """
+    Genera los informes de ``datasets`` (``{nombre: ruta}``) que hayan cambiado.
+
+    Devuelve ``(generados, omitidos, fallidos)``; ``fallidos`` es ``{nombre: error}``.
+    """
+    os.makedirs(directorio, exist_ok=True)
+    manifiesto = cargar_manifiesto(directorio)
+    tareas, omitidos = [], []
+    for nombre, ruta in datasets.items():
+        huella = huella_informe(ruta, png)
+        if not forzar and _vigente(manifiesto.get(nombre), huella, directorio):
+            omitidos.append(nombre)
+        else:
+            tareas.append((nombre, ruta, directorio, png, huella))
+
+    generados, fallidos = [], {}
+    for nombre, entrada, error in _ejecutar(tareas, min(procesos or os.cpu_count() or 1, len(tareas))):
+        if error is not None:
+            fallidos[nombre] = repr(error)
+            continue
+        manifiesto[nombre] = entrada
+        generados.append(nombre)
+        guardar_manifiesto(directorio, manifiesto)  # lo ya generado no se repite si se interrumpe
+    return generados, omitidos, fallidos
+
+
+def _datasets(entradas):
+    """``{nombre: ruta}`` de los archivos indicados o de los contenidos en las carpetas indicadas."""
+    encontrados = {}
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            rutas = sorted(os.path.join(entrada, f) for f in os.listdir(entrada)
+                           if f.lower().endswith(EXTENSIONES) and not f.startswith("~$"))
+        else:
+            rutas = [entrada]
+        for ruta in rutas:
+            encontrados[os.path.splitext(os.path.basename(ruta))[0]] = ruta
+    return encontrados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Informes HTML estáticos de 'Presentación y Datos'.")
+    parser.add_argument("entradas", nargs="*", help="Datasets o carpetas con datasets (XLSX, CSV o Parquet)")
+    parser.add_argument("--portafolios", action="store_true", help="Incluir todas las carteras registradas")
+    parser.add_argument("--salida", default="informes")
+    parser.add_argument("--procesos", type=int, help="Por defecto, todos los núcleos")
+    parser.add_argument("--png", action="store_true", help="Guardar también cada figura como PNG")
+    parser.add_argument("--forzar", action="store_true", help="Regenerar aunque la entrada no haya cambiado")
+    args = parser.parse_args(argv)
+
+    datasets = _datasets(args.entradas)
+    if args.portafolios:
+        from portafolios import portafolios
+
+        datasets.update(portafolios())
+    if not datasets:
+        parser.error("Indica algún dataset o usa --portafolios")
+
+    inicio = time.perf_counter()
+    generados, omitidos, fallidos = generar_informes(datasets, args.salida, args.procesos, args.png, args.forzar)
+    for nombre, error in fallidos.items():
+        print(f"❌ {nombre}: {error}")
+    print(f"✅ {len(generados)} generados, {len(omitidos)} sin cambios, {len(fallidos)} con errores "
+          f"en {time.perf_counter() - inicio:.1f} s → '{args.salida}'")
+    if fallidos:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
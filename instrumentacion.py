@@ -0,0 +1,148 @@
+"""
+⏱️ Instrumentación de los puntos calientes de cada ejecución (rerun) de la app.
+
+- ``tramo(nombre)``: context manager que mide duración y variación de memoria
+  residente (RSS) de un bloque y la anota en el registro del rerun actual. Fuera de
+  un rerun (CLI, hilos en segundo plano) no hace nada.
+- ``iniciar_rerun(pagina)`` / ``cerrar_rerun()``: delimitan cada ejecución del script.
+- ``CFC_PERFILADO=1`` muestra el desglose del rerun en la barra lateral.
+- ``CFC_METRICAS_JSONL=ruta`` añade una línea JSON por rerun a ese archivo para
+  poder agregarlas entre sesiones en producción.
+"""
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+
+PERFILADO = os.environ.get("CFC_PERFILADO", "").lower() in ("1", "true", "si", "sí")
+ARCHIVO_METRICAS = os.environ.get("CFC_METRICAS_JSONL")
+
+_PAGINA = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def memoria_residente():
+    """RSS actual del proceso en bytes (Linux); ``None`` si no está disponible."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGINA
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+@dataclass
+class Tramo:
+    nombre: str
+    nivel: int
+    inicio_ms: float
+    duracion_ms: float = 0.0
+    delta_rss_mb: float = None
+
+
+@dataclass
+class RegistroRerun:
+    pagina: str
+    sesion: str
+    inicio: float = field(default_factory=time.time)
+    tramos: list = field(default_factory=list)
+    duracion_ms: float = 0.0
+    rss_mb: float = None
+    _t0: float = field(default_factory=time.perf_counter, repr=False)
+    _nivel: int = field(default=0, repr=False)
+
+    def como_dict(self):
+        datos = asdict(self)
+        datos.pop("_t0")
+        datos.pop("_nivel")
+        return datos
+
+
+_actual = contextvars.ContextVar("registro_rerun", default=None)
+_bloqueo_archivo = threading.Lock()
+
+
+@contextmanager
+def tramo(nombre):
+    """Mide el bloque ``with`` y lo anota en el rerun actual (si lo hay)."""
+    registro = _actual.get()
+    if registro is None:
+        yield
+        return
+    anotacion = Tramo(nombre, registro._nivel, (time.perf_counter() - registro._t0) * 1000)
+    registro.tramos.append(anotacion)
+    rss_antes = memoria_residente()
+    registro._nivel += 1
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        anotacion.duracion_ms = (time.perf_counter() - inicio) * 1000
+        registro._nivel -= 1
+        rss_despues = memoria_residente()
+        if rss_antes is not None and rss_despues is not None:
+            anotacion.delta_rss_mb = (rss_despues - rss_antes) / 2 ** 20
+
+
+def iniciar_rerun(pagina, sesion=None):
+    """Abre el registro de un rerun; si el anterior quedó abierto (``st.stop()``), lo cierra antes."""
+    if _actual.get() is not None:
+        cerrar_rerun()
+    registro = RegistroRerun(pagina=pagina, sesion=sesion or uuid.uuid4().hex[:8])
+    _actual.set(registro)
+    return registro
+
+
+def cerrar_rerun():
+    """Cierra el rerun actual, lo exporta a JSONL si está configurado y lo devuelve."""
+    registro = _actual.get()
+    if registro is None:
+        return None
+    _actual.set(None)
+    registro.duracion_ms = (time.perf_counter() - registro._t0) * 1000
+    rss = memoria_residente()
+    registro.rss_mb = None if rss is None else rss / 2 ** 20
+    if ARCHIVO_METRICAS:
+        exportar(registro, ARCHIVO_METRICAS)
+    return registro
+
+
+def exportar(registro, destino):
+    linea = json.dumps(registro.como_dict(), ensure_ascii=False)
+    with _bloqueo_archivo, open(destino, "a", encoding="utf-8") as f:
+        f.write(linea + "\n")
+
+
+def mostrar_panel(registro, modelos=()):
+    """
+    Desglose del rerun en la barra lateral de Streamlit.
+
+    ``modelos``: filas de ``modelos.RegistroModelos.estadisticas()`` (tiempo de carga
+    y memoria de cada modelo cargado en el proceso).
+    """
+    import pandas as pd
+    import streamlit as st
+
+    with st.sidebar.expander(f"⏱️ Perfil del rerun · {registro.duracion_ms:,.0f} ms", expanded=False):
+        if registro.tramos:
+            tabla = pd.DataFrame([{
+                "Tramo": "  " * t.nivel + t.nombre,
+                "ms": round(t.duracion_ms, 1),
+                "Δ RSS (MB)": None if t.delta_rss_mb is None else round(t.delta_rss_mb, 1),
+            } for t in registro.tramos])
+            st.dataframe(tabla, hide_index=True)
+        else:
+            st.write("Sin tramos registrados.")
+        if modelos:
+            st.markdown("**Modelos cargados**")
+            st.dataframe(pd.DataFrame([{
+                "Modelo": os.path.basename(m["ruta"]),
+                "Versión": m["version"],
+                "Carga (ms)": round(m["tiempo_carga_s"] * 1000, 1),
+                "Memoria (MB)": round(m["memoria_kb"] / 1024, 1),
+                "Estado": "recargando" if m["recargando"] else "con error" if m["ultimo_error"] else "vigente",
+            } for m in modelos]), hide_index=True)
+        if registro.rss_mb is not None:
+            st.caption(f"Memoria residente del proceso: {registro.rss_mb:,.0f} MB")
@@ -0,0 +1,201 @@
+"""
+📦 Puntuación masiva de carteras de proyectos.
+
+Lee un archivo CSV, Excel (XLSX, XLS, XLSM u ODS) o Parquet por bloques, codifica y puntúa cada bloque de
+forma vectorizada y va escribiendo los resultados a disco, de modo que la memoria
+queda acotada por el tamaño de bloque y no por el tamaño del archivo.
+
+Uso desde la línea de comandos::
+
+    python lotes.py cartera.csv resultados.parquet --tam-bloque 200000
+"""
+import argparse
+import os
+import time
+import zipfile
+from collections import Counter
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from datos import EXTENSIONES_EXCEL
+from pipeline import ARCHIVO_PIPELINE, obtener_pipeline
+from prediccion import COLUMNA_NIVEL, COLUMNA_PREDICCION, clasificar_riesgo
+
+TAM_BLOQUE = 100_000
+FORMATOS = (".csv", ".parquet") + EXTENSIONES_EXCEL
+
+
+@dataclass
+class ResumenLote:
+    filas: int = 0
+    segundos: float = 0.0
+    niveles: Counter = field(default_factory=Counter)
+
+    @property
+    def filas_por_segundo(self):
+        return self.filas / self.segundos if self.segundos else 0.0
+
+
+def _extension(origen, nombre=None):
+    extension = os.path.splitext(nombre or str(origen))[1].lower()
+    if extension not in FORMATOS:
+        raise ValueError(f"Formato no soportado: '{nombre or origen}'. Use CSV, Excel (XLSX, XLS, XLSM, ODS) o Parquet.")
+    return extension
+
+
+def _es_ooxml(origen):
+    """Si ``origen`` es un libro OOXML (zip con ``[Content_Types].xml``), lo único que abre openpyxl."""
+    try:
+        with zipfile.ZipFile(origen) as archivo:
+            return "[Content_Types].xml" in archivo.namelist()
+    except zipfile.BadZipFile:
+        return False
+    finally:
+        if hasattr(origen, "seek"):
+            origen.seek(0)
+
+
+def _bloques_excel(origen, tam_bloque):
+    from openpyxl import load_workbook
+    from openpyxl.utils.exceptions import InvalidFileException
+
+    libro = None
+    if _es_ooxml(origen):
+        try:
+            libro = load_workbook(origen, read_only=True, data_only=True)
+        except (InvalidFileException, KeyError, zipfile.BadZipFile):
+            if hasattr(origen, "seek"):
+                origen.seek(0)
+    if libro is None:
+        # XLS, ODS (aunque se llame .xlsx) o libros que openpyxl no abre: lectura completa con el motor
+        # que detecte pandas, troceada en bloques; la memoria ya no queda acotada por el bloque
+        df = pd.read_excel(origen)
+        for inicio in range(0, len(df), tam_bloque):
+            yield df.iloc[inicio:inicio + tam_bloque]
+        return
+    try:
+        filas = libro.active.iter_rows(values_only=True)
+        cabecera = next(filas, None)
+        if cabecera is None:
+            return
+        bloque = []
+        for fila in filas:
+            bloque.append(fila)
+            if len(bloque) == tam_bloque:
+                yield pd.DataFrame(bloque, columns=cabecera)
+                bloque = []
+        if bloque:
+            yield pd.DataFrame(bloque, columns=cabecera)
+    finally:
+        libro.close()
+
+
+def leer_por_bloques(origen, tam_bloque=TAM_BLOQUE, nombre=None):
+    """
+    Itera sobre ``origen`` en DataFrames de como mucho ``tam_bloque`` filas.
+
+    ``origen`` puede ser una ruta o un objeto tipo archivo (p. ej. lo que devuelve
+    ``st.file_uploader``); en ese caso ``nombre`` indica el formato.
+    """
+    extension = _extension(origen, nombre)
+    if extension == ".csv":
+        yield from pd.read_csv(origen, chunksize=tam_bloque)
+    elif extension == ".parquet":
+        import pyarrow.parquet as pq
+
+        for lote in pq.ParquetFile(origen).iter_batches(batch_size=tam_bloque):
+            yield lote.to_pandas()
+    else:
+        yield from _bloques_excel(origen, tam_bloque)
+
+
+def puntuar_bloque(bloque, pipeline):
+    """Añade al bloque la predicción y la banda de riesgo de cada fila."""
+    X = pipeline.codificar(bloque, desconocidas="nan")
+    validas = ~np.isnan(X).any(axis=1)
+    predicciones = np.full(len(bloque), np.nan)
+    if validas.any():
+        predicciones[validas] = pipeline.predecir(X[validas])
+    return bloque.assign(**{COLUMNA_PREDICCION: predicciones, COLUMNA_NIVEL: clasificar_riesgo(predicciones)})
+
+
+class EscritorResultados:
+    """Escritura incremental en CSV o Parquet, bloque a bloque."""
+
+    def __init__(self, destino):
+        self.destino = destino
+        self.extension = _extension(destino)
+        if self.extension == ".xlsx":
+            raise ValueError("La salida debe ser CSV o Parquet para poder escribirse por bloques.")
+        self._parquet = None
+        self._primero = True
+
+    def escribir(self, bloque):
+        if self.extension == ".csv":
+            bloque.to_csv(self.destino, mode="w" if self._primero else "a", header=self._primero, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self._parquet is None:
+                tabla = pa.Table.from_pandas(bloque, preserve_index=False)
+                self._parquet = pq.ParquetWriter(self.destino, tabla.schema)
+            else:
+                tabla = pa.Table.from_pandas(bloque, schema=self._parquet.schema, preserve_index=False)
+            self._parquet.write_table(tabla)
+        self._primero = False
+
+    def cerrar(self):
+        if self._parquet is not None:
+            self._parquet.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def puntuar_archivo(origen, destino, pipeline, tam_bloque=TAM_BLOQUE, nombre=None, al_avanzar=None):
+    """
+    Puntúa ``origen`` completo escribiendo en ``destino`` a medida que avanza.
+
+    ``al_avanzar(resumen)`` se llama tras cada bloque (útil para barras de progreso).
+    """
+    resumen = ResumenLote()
+    inicio = time.perf_counter()
+    with EscritorResultados(destino) as escritor:
+        for bloque in leer_por_bloques(origen, tam_bloque, nombre):
+            resultado = puntuar_bloque(bloque, pipeline)
+            escritor.escribir(resultado)
+            resumen.filas += len(resultado)
+            resumen.niveles.update(resultado[COLUMNA_NIVEL].value_counts().to_dict())
+            resumen.segundos = time.perf_counter() - inicio
+            if al_avanzar is not None:
+                al_avanzar(resumen)
+    resumen.segundos = time.perf_counter() - inicio
+    return resumen
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Puntuación masiva del riesgo de retraso.")
+    parser.add_argument("entrada", help="Cartera de proyectos (CSV, Excel o Parquet)")
+    parser.add_argument("salida", help="Archivo de resultados (CSV o Parquet)")
+    parser.add_argument("--tam-bloque", type=int, default=TAM_BLOQUE, help="Filas por bloque")
+    parser.add_argument("--pipeline", default=ARCHIVO_PIPELINE, help="Artefacto generado con entrenar.py")
+    args = parser.parse_args(argv)
+
+    pipeline, _ = obtener_pipeline(args.pipeline)
+    resumen = puntuar_archivo(
+        args.entrada, args.salida, pipeline, args.tam_bloque,
+        al_avanzar=lambda r: print(f"  {r.filas:,} filas · {r.filas_por_segundo:,.0f} filas/s", flush=True),
+    )
+    print(f"✅ {resumen.filas:,} filas en {resumen.segundos:.2f} s ({resumen.filas_por_segundo:,.0f} filas/s)")
+    for nivel, cantidad in sorted(resumen.niveles.items()):
+        print(f"   {nivel}: {cantidad:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+🧠 Registro de modelos con caché de proceso y recarga en caliente.
+
+Cada artefacto (p. ej. ``modelo_regresion.pkl``) se deserializa una sola vez por
+proceso y se identifica por el hash de su contenido y un número de versión que
+aumenta con cada recarga. Si se deja un pickle nuevo en la misma ruta, se carga en
+un hilo en segundo plano mientras las peticiones en curso siguen usando el modelo
+anterior; cuando termina, el cambio de referencia es atómico.
+
+Para publicar un modelo nuevo sin que se lea a medio escribir, conviene volcarlo a
+un archivo temporal y moverlo con ``os.replace``.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import joblib
+
+from datos import huella_archivo
+from instrumentacion import memoria_residente, tramo
+
+ARCHIVO_MODELO = "modelo_regresion.pkl"
+
+
+@dataclass(frozen=True)
+class ModeloCargado:
+    """
+    Modelo deserializado junto con sus metadatos de carga.
+
+    ``memoria_bytes`` es el aumento de memoria residente (RSS) durante la carga; en
+    la primera carga del proceso incluye los módulos que el pickle importe (sklearn).
+    """
+    objeto: object
+    ruta: str
+    huella: str
+    version: int
+    tiempo_carga: float
+    memoria_bytes: int
+    cargado_en: float
+
+
+# Las cargas medidas se serializan para que el RSS de una no se mezcle con el de otra.
+# (No se usa tracemalloc: ralentiza todo el proceso mientras el pickle importa sklearn.)
+_bloqueo_medicion = threading.Lock()
+
+
+def _cargar_midiendo(cargador, ruta):
+    """Ejecuta el cargador y devuelve (objeto, segundos, bytes retenidos)."""
+    with _bloqueo_medicion:
+        antes = memoria_residente() or 0
+        inicio = time.perf_counter()
+        objeto = cargador(ruta)
+        segundos = time.perf_counter() - inicio
+        return objeto, segundos, max((memoria_residente() or 0) - antes, 0)
+
+
+class _Entrada:
+    def __init__(self):
+        self.bloqueo = threading.Lock()
+        self.bloqueo_carga = threading.Lock()
+        self.modelo = None
+        self.sello = None
+        self.sello_fallido = None
+        self.recargando = False
+        self.error = None
+
+
+class RegistroModelos:
+    """
+    Caché de modelos por ruta, segura entre hilos (sesiones de Streamlit).
+
+    - La primera petición de una ruta carga el modelo de forma síncrona.
+    - Las siguientes solo hacen ``os.stat``; si el archivo ha cambiado, se lanza
+      la recarga en segundo plano y se sigue devolviendo la versión vigente.
+    """
+
+    def __init__(self, cargador=joblib.load, recarga_en_segundo_plano=True):
+        self._cargador = cargador
+        self._segundo_plano = recarga_en_segundo_plano
+        self._entradas = {}
+        self._bloqueo = threading.Lock()
+
+    def _entrada(self, ruta):
+        with self._bloqueo:
+            return self._entradas.setdefault(ruta, _Entrada())
+
+    def _recargar(self, entrada, ruta, sello):
+        """Carga el archivo y sustituye el modelo vigente si el contenido es nuevo."""
+        try:
+            huella = huella_archivo(ruta)
+            vigente = entrada.modelo
+            if vigente is not None and vigente.huella == huella:
+                nuevo = vigente
+            else:
+                objeto, segundos, memoria = _cargar_midiendo(self._cargador, ruta)
+                nuevo = ModeloCargado(
+                    objeto=objeto,
+                    ruta=ruta,
+                    huella=huella,
+                    version=(vigente.version + 1) if vigente is not None else 1,
+                    tiempo_carga=segundos,
+                    memoria_bytes=memoria,
+                    cargado_en=time.time(),
+                )
+            with entrada.bloqueo:
+                entrada.modelo, entrada.sello, entrada.error = nuevo, sello, None
+            return nuevo
+        except Exception as e:
+            # Se conserva el modelo anterior; se reintenta cuando el archivo vuelva a cambiar
+            with entrada.bloqueo:
+                entrada.sello_fallido, entrada.error = sello, e
+            raise
+        finally:
+            with entrada.bloqueo:
+                entrada.recargando = False
+
+    def _recargar_en_hilo(self, entrada, ruta, sello):
+        try:
+            self._recargar(entrada, ruta, sello)
+        except Exception:
+            pass  # el error queda registrado en la entrada
+
+    def obtener(self, ruta=ARCHIVO_MODELO):
+        """Devuelve el ``ModeloCargado`` vigente para ``ruta``."""
+        ruta = os.path.abspath(ruta)
+        info = os.stat(ruta)  # FileNotFoundError si no existe
+        sello = (info.st_mtime_ns, info.st_size)
+        entrada = self._entrada(ruta)
+
+        with entrada.bloqueo:
+            modelo = entrada.modelo
+            if modelo is not None and (entrada.sello == sello or entrada.sello_fallido == sello):
+                return modelo
+            lanzar = modelo is not None and self._segundo_plano and not entrada.recargando
+            if lanzar:
+                entrada.recargando = True
+
+        if lanzar:
+            threading.Thread(target=self._recargar_en_hilo, args=(entrada, ruta, sello), daemon=True).start()
+            return modelo
+        if modelo is not None and self._segundo_plano:
+            return modelo  # ya hay una recarga en marcha
+
+        # Primera carga (o recarga síncrona): las demás sesiones esperan a esta
+        with entrada.bloqueo_carga:
+            with entrada.bloqueo:
+                if entrada.modelo is not None and entrada.sello == sello:
+                    return entrada.modelo
+                entrada.recargando = True
+            with tramo(f"modelo:cargar {os.path.basename(ruta)}"):
+                return self._recargar(entrada, ruta, sello)
+
+    def estadisticas(self):
+        """Tiempo de carga, memoria y versión de cada modelo cargado."""
+        with self._bloqueo:
+            entradas = list(self._entradas.items())
+        filas = []
+        for ruta, entrada in entradas:
+            modelo = entrada.modelo
+            if modelo is None:
+                continue
+            filas.append({
+                "ruta": ruta,
+                "version": modelo.version,
+                "huella": modelo.huella[:12],
+                "tiempo_carga_s": round(modelo.tiempo_carga, 4),
+                "memoria_kb": round(modelo.memoria_bytes / 1024, 1),
+                "recargando": entrada.recargando,
+                "ultimo_error": repr(entrada.error) if entrada.error else None,
+            })
+        return filas
+
+    def vaciar(self):
+        with self._bloqueo:
+            self._entradas.clear()
+
+
+# 📌 Registro compartido por todo el proceso
+registro = RegistroModelos()
+
+
+def obtener_modelo(ruta=ARCHIVO_MODELO):
+    """Atajo sobre el registro global."""
+    return registro.obtener(ruta)
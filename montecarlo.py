@@ -0,0 +1,282 @@
+"""
+🎲 Simulación Monte Carlo del riesgo de retraso.
+
+En lugar de una única estimación, cada proyecto se evalúa sobre cientos de miles
+de escenarios que propagan por el modelo la incertidumbre de las entradas
+(duración ± meses, rango de sobrecoste, probabilidad de cada clima) y el error
+residual del propio modelo. El resultado son percentiles y la probabilidad de
+caer en cada banda de riesgo.
+
+Los escenarios se generan y puntúan en lotes de NumPy de ``TAM_LOTE`` filas, cada
+uno con su propia semilla derivada de ``SeedSequence(semilla)``: el resultado es
+idéntico con uno o con varios procesos. Las carteras se reparten por proyectos
+entre un pool de procesos.
+
+Uso::
+
+    python montecarlo.py cartera.csv riesgo_simulado.csv --escenarios 100000 --procesos 8
+"""
+import argparse
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from pipeline import CategoriaDesconocida
+from prediccion import NIVELES_RIESGO, UMBRAL_RIESGO_BAJO, UMBRAL_RIESGO_MODERADO
+
+ESCENARIOS = 200_000
+TAM_LOTE = 100_000
+PERCENTILES = (5, 25, 50, 75, 95)
+UMBRALES = (UMBRAL_RIESGO_BAJO, UMBRAL_RIESGO_MODERADO)
+
+
+@dataclass(frozen=True)
+class Incertidumbre:
+    """
+    Incertidumbre de las entradas de un proyecto.
+
+    - ``desviacion_duracion``: desviación típica (meses) de una normal centrada en la duración prevista.
+    - ``sobrecoste``: rango ``(mín, máx)`` uniforme del sobrecoste relativo (``0.2`` = +20 %).
+    - ``probabilidades_clima``: ``{clima: probabilidad}``; ``None`` mantiene el clima indicado.
+    - ``sigma_residual``: desviación típica del error del modelo (puntos de riesgo).
+    """
+    desviacion_duracion: float = 2.0
+    sobrecoste: tuple = (0.0, 0.2)
+    probabilidades_clima: dict = None
+    sigma_residual: float = 0.0
+
+
+@dataclass
+class ResultadoSimulacion:
+    escenarios: int
+    media: float
+    desviacion: float
+    percentiles: dict
+    probabilidades: dict          # banda de riesgo -> probabilidad
+    prob_superar: dict            # umbral (%) -> P(riesgo >= umbral)
+    segundos: float = 0.0
+    muestras: np.ndarray = field(default=None, repr=False)
+
+    @staticmethod
+    def columnas(percentiles=PERCENTILES):
+        """Columnas de ``como_dict`` (las de la tabla de ``simular_cartera``)."""
+        return (["Escenarios", "Media (%)", "Desv. (%)"] + [f"P{p} (%)" for p in percentiles]
+                + [f"P(≥{u} %)" for u in UMBRALES])
+
+    def como_dict(self):
+        return {
+            "Escenarios": self.escenarios,
+            "Media (%)": self.media,
+            "Desv. (%)": self.desviacion,
+            **{f"P{p} (%)": v for p, v in self.percentiles.items()},
+            **{f"P(≥{u} %)": v for u, v in self.prob_superar.items()},
+        }
+
+
+def _resumir(muestras, percentiles=PERCENTILES, segundos=0.0, conservar=False):
+    frecuencias = np.bincount(np.digitize(muestras, UMBRALES), minlength=len(NIVELES_RIESGO)) / len(muestras)
+    return ResultadoSimulacion(
+        escenarios=len(muestras),
+        media=float(muestras.mean()),
+        desviacion=float(muestras.std()),
+        percentiles=dict(zip(percentiles, np.percentile(muestras, percentiles).tolist())),
+        probabilidades={str(n): float(f) for n, f in zip(NIVELES_RIESGO, frecuencias)},
+        prob_superar={u: float((muestras >= u).mean()) for u in UMBRALES},
+        segundos=segundos,
+        muestras=muestras if conservar else None,
+    )
+
+
+def _tamanos_lote(escenarios, tam_lote):
+    return [min(tam_lote, escenarios - inicio) for inicio in range(0, escenarios, tam_lote)]
+
+
+def simular_lotes(pipeline, proyecto, incertidumbre, semillas, tamanos):
+    """Riesgo simulado de los lotes indicados (cada lote con su semilla); devuelve un array ``float32``."""
+    base = pipeline.codificar_fila(**proyecto)
+    columnas = pipeline.columnas
+    j_duracion = columnas.index("Duración (meses)")
+    j_costo = columnas.index("Costo Total (€)")
+    j_clima = columnas.index("Clima Predominante")
+    climas = None
+    if incertidumbre.probabilidades_clima:
+        nombres = list(incertidumbre.probabilidades_clima)
+        climas = np.array([pipeline.codificar_fila(**{**proyecto, "Clima Predominante": c})[j_clima] for c in nombres])
+        pesos = np.array([incertidumbre.probabilidades_clima[c] for c in nombres], dtype=float)
+        pesos /= pesos.sum()
+
+    resultados = []
+    for semilla, n in zip(semillas, tamanos):
+        rng = np.random.default_rng(semilla)
+        X = np.broadcast_to(base, (n, len(base))).copy()
+        X[:, j_duracion] = np.maximum(rng.normal(base[j_duracion], incertidumbre.desviacion_duracion, n), 1.0)
+        X[:, j_costo] = base[j_costo] * (1.0 + rng.uniform(*incertidumbre.sobrecoste, n))
+        if climas is not None:
+            X[:, j_clima] = climas[rng.choice(len(climas), n, p=pesos)]
+        riesgo = pipeline.predecir(X)
+        if incertidumbre.sigma_residual:
+            riesgo = riesgo + rng.normal(0.0, incertidumbre.sigma_residual, n)
+        resultados.append(riesgo.astype(np.float32))
+    return np.concatenate(resultados) if resultados else np.empty(0, dtype=np.float32)
+
+
+# ⚙️ Procesos: el pipeline se envía una sola vez a cada trabajador
+_pipeline_trabajador = None
+
+
+def _iniciar_trabajador(pipeline):
+    global _pipeline_trabajador
+    _pipeline_trabajador = pipeline
+
+
+def _simular_en_trabajador(argumentos):
+    return simular_lotes(_pipeline_trabajador, *argumentos)
+
+
+def _resumir_proyecto(pipeline, argumentos):
+    proyecto, incertidumbre, semilla, escenarios, tam_lote, percentiles = argumentos
+    tamanos = _tamanos_lote(escenarios, tam_lote)
+    try:
+        muestras = simular_lotes(pipeline, proyecto, incertidumbre, semilla.spawn(len(tamanos)), tamanos)
+    except CategoriaDesconocida:
+        return None  # como en lotes.py: el proyecto queda sin predicción y el resto sigue
+    return _resumir(muestras, percentiles)
+
+
+def _resumir_en_trabajador(argumentos):
+    return _resumir_proyecto(_pipeline_trabajador, argumentos)
+
+
+def simular(pipeline, proyecto, incertidumbre=Incertidumbre(), escenarios=ESCENARIOS, semilla=0, procesos=1,
+            tam_lote=TAM_LOTE, percentiles=PERCENTILES, conservar_muestras=False):
+    """
+    Distribución del riesgo de un proyecto (``{columna: valor}``, como ``codificar_fila``).
+
+    Con ``procesos > 1`` los lotes se reparten entre procesos; el resultado no cambia.
+    """
+    inicio = time.perf_counter()
+    tamanos = _tamanos_lote(escenarios, tam_lote)
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+    if procesos > 1 and len(tamanos) > 1:
+        trozos = np.array_split(np.arange(len(tamanos)), min(procesos, len(tamanos)))
+        tareas = [(proyecto, incertidumbre, [semillas[k] for k in t], [tamanos[k] for k in t]) for t in trozos]
+        with ProcessPoolExecutor(max_workers=len(tareas), initializer=_iniciar_trabajador,
+                                 initargs=(pipeline,)) as pool:
+            muestras = np.concatenate(list(pool.map(_simular_en_trabajador, tareas)))
+    else:
+        muestras = simular_lotes(pipeline, proyecto, incertidumbre, semillas, tamanos)
+    return _resumir(muestras, percentiles, time.perf_counter() - inicio, conservar_muestras)
+
+
+def simular_cartera(pipeline, df, incertidumbre=Incertidumbre(), escenarios=ESCENARIOS, semilla=0, procesos=None,
+                    tam_lote=TAM_LOTE, percentiles=PERCENTILES):
+    """
+    Resumen de la simulación de cada proyecto de ``df``, repartidos entre ``procesos``.
+
+    Cada proyecto recibe una semilla derivada de ``semilla`` y de su posición, así
+    que el resultado no depende del número de procesos. Los proyectos con una
+    categoría que el modelo no conoce quedan con el resumen a ``NaN``.
+    """
+    proyectos = df.to_dict("records")
+    semillas = np.random.SeedSequence(semilla).spawn(len(proyectos))
+    tareas = [(p, incertidumbre, s, escenarios, tam_lote, percentiles) for p, s in zip(proyectos, semillas)]
+    procesos = procesos or os.cpu_count() or 1
+    if procesos > 1 and len(tareas) > 1:
+        with ProcessPoolExecutor(max_workers=min(procesos, len(tareas)), initializer=_iniciar_trabajador,
+                                 initargs=(pipeline,)) as pool:
+            resultados = list(pool.map(_resumir_en_trabajador, tareas, chunksize=max(1, len(tareas) // (4 * procesos))))
+    else:
+        resultados = [_resumir_proyecto(pipeline, t) for t in tareas]
+    filas = {i: r.como_dict() for i, r in zip(df.index, resultados) if r is not None}
+    return pd.DataFrame.from_dict(filas, orient="index").reindex(
+        index=df.index, columns=ResultadoSimulacion.columnas(percentiles))
+
+
+# 📌 Error residual por (versión del modelo, versión de los datos) cuando el artefacto no lo trae;
+# se conservan los más recientes (una entrada por cartera en uso)
+MAX_SIGMAS = 8
+_sigmas = OrderedDict()
+_bloqueo = threading.Lock()
+
+
+def probabilidades_clima(pipeline, conteos):
+    """
+    Probabilidad de cada clima según ``conteos`` (clima -> proyectos), solo entre los que conoce el modelo.
+
+    Un dataset puede traer climas que el pipeline no sabe codificar; sortearlos dejaría
+    los proyectos sin simular. Devuelve ``None`` si no queda ningún clima conocido.
+    """
+    conteos = pd.Series(conteos, dtype=float).reindex(pipeline.clases("Clima Predominante"), fill_value=0)
+    total = conteos.sum()
+    return (conteos / total).to_dict() if total > 0 else None
+
+
+def sigma_residual(pipeline, version_modelo, conjunto, objetivo="Riesgo de Retraso (%)"):
+    """
+    Desviación típica del error del modelo.
+
+    Usa ``metadatos["sigma_residual"]`` si el artefacto la trae (``entrenar.py --cv``,
+    ``incremental.py``); si no, se estima una vez sobre el dataset.
+    """
+    sigma = pipeline.metadatos.get("sigma_residual")
+    if sigma is not None:
+        return float(sigma)
+    clave = (version_modelo, conjunto.version)
+    with _bloqueo:
+        if clave in _sigmas:
+            _sigmas.move_to_end(clave)
+            return _sigmas[clave]
+        X = pipeline.codificar(conjunto.df)
+        residuos = conjunto.df[objetivo].to_numpy(dtype=float) - pipeline.predecir(X)
+        _sigmas[clave] = float(np.nanstd(residuos, ddof=1))
+        while len(_sigmas) > MAX_SIGMAS:
+            _sigmas.popitem(last=False)
+        return _sigmas[clave]
+
+
+def main(argv=None):
+    from datos import obtener_datos
+    from lotes import leer_por_bloques
+    from pipeline import obtener_pipeline
+
+    parser = argparse.ArgumentParser(description="Simulación Monte Carlo del riesgo de una cartera de proyectos.")
+    parser.add_argument("entrada", help="Cartera de proyectos (CSV, Excel o Parquet)")
+    parser.add_argument("salida", help="Resultados (CSV)")
+    parser.add_argument("--escenarios", type=int, default=ESCENARIOS)
+    parser.add_argument("--procesos", type=int, help="Por defecto, todos los núcleos")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--desviacion-duracion", type=float, default=Incertidumbre.desviacion_duracion)
+    parser.add_argument("--sobrecoste", type=float, nargs=2, default=Incertidumbre.sobrecoste, metavar=("MIN", "MAX"))
+    parser.add_argument("--clima-incierto", action="store_true",
+                        help="Sortear el clima con las frecuencias del dataset")
+    args = parser.parse_args(argv)
+
+    pipeline, version_modelo = obtener_pipeline()
+    conjunto = obtener_datos()
+    probabilidades = None
+    if args.clima_incierto:
+        probabilidades = probabilidades_clima(pipeline, conjunto.df["Clima Predominante"].value_counts())
+        if probabilidades is None:
+            print("⚠️ Ningún clima del dataset está en los datos de entrenamiento: se mantiene el de cada proyecto")
+    incertidumbre = Incertidumbre(args.desviacion_duracion, tuple(args.sobrecoste), probabilidades,
+                                  sigma_residual(pipeline, version_modelo, conjunto))
+
+    inicio = time.perf_counter()
+    cartera = pd.concat(leer_por_bloques(args.entrada), ignore_index=True)
+    resultados = simular_cartera(pipeline, cartera, incertidumbre, args.escenarios, args.semilla, args.procesos)
+    pd.concat([cartera, resultados], axis=1).to_csv(args.salida, index=False)
+    segundos = time.perf_counter() - inicio
+    print(f"✅ {len(cartera):,} proyectos × {args.escenarios:,} escenarios en {segundos:.1f} s → '{args.salida}'")
+    sin_simular = int(resultados["Escenarios"].isna().sum())
+    if sin_simular:
+        print(f"⚠️ {sin_simular:,} proyectos sin simulación (categorías que el modelo no conoce)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+⚡ Motor de puntuación nativo para modelos lineales.
+
+Extrae ``coef_`` e ``intercept_`` de un regresor lineal de scikit-learn y puntúa
+con un producto escalar de NumPy, sin construir DataFrames ni validar nombres de
+columnas. El motor puede guardarse en un ``.npz`` y cargarse en otros servicios
+que solo dispongan de NumPy.
+
+Ejemplo::
+
+    motor = MotorLineal.desde_modelo(joblib.load("modelo_regresion.pkl"))
+    motor.puntuar([0, 5, 18, 1_500_000, 1, 2, 80, 4.5])   # -> float
+    motor.puntuar(X)                                       # X: (n, 8) -> (n,)
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class MotorLineal:
+    coeficientes: np.ndarray
+    intercepto: float
+    columnas: tuple = ()
+
+    @classmethod
+    def desde_modelo(cls, modelo, columnas=None):
+        """Construye el motor a partir de un regresor lineal ya entrenado."""
+        coef = getattr(modelo, "coef_", None)
+        if coef is None or np.ndim(coef) != 1:
+            raise TypeError(f"{type(modelo).__name__} no es un regresor lineal de una sola salida")
+        if columnas is None:
+            columnas = getattr(modelo, "feature_names_in_", ())
+        coeficientes = np.ascontiguousarray(coef, dtype=np.float64)
+        coeficientes.flags.writeable = False
+        return cls(coeficientes, float(np.ravel(modelo.intercept_)[0]), tuple(columnas))
+
+    @classmethod
+    def es_compatible(cls, modelo):
+        return np.ndim(getattr(modelo, "coef_", None)) == 1 and hasattr(modelo, "intercept_")
+
+    def puntuar(self, X):
+        """
+        Una fila (vector de ``n_columnas``) devuelve un ``float``; una matriz
+        ``(n, n_columnas)`` devuelve un array de ``n`` predicciones.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.shape[-1] != self.coeficientes.shape[0]:
+            raise ValueError(f"Se esperaban {self.coeficientes.shape[0]} columnas y se recibieron {X.shape[-1]}")
+        if X.ndim == 1:
+            return float(self.coeficientes @ X) + self.intercepto
+        return X @ self.coeficientes + self.intercepto
+
+    def guardar(self, destino):
+        """Guarda coeficientes, intercepto y columnas en un ``.npz`` sin dependencias de sklearn."""
+        np.savez(destino, coeficientes=self.coeficientes, intercepto=self.intercepto,
+                 columnas=np.array(self.columnas, dtype=str))
+
+    @classmethod
+    def cargar(cls, origen):
+        with np.load(origen) as archivo:
+            coeficientes = archivo["coeficientes"].astype(np.float64)
+            coeficientes.flags.writeable = False
+            return cls(coeficientes, float(archivo["intercepto"]), tuple(archivo["columnas"].tolist()))
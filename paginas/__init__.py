@@ -0,0 +1,110 @@
+"""
+🗂️ Páginas de la aplicación, cargadas bajo demanda.
+
+Cada página vive en su propio módulo con una función ``mostrar()``. ``app.py`` solo
+importa el módulo de la página elegida, así que abrir *Conclusiones y Perfil* no
+paga la importación de scikit-learn ni la carga del dataset. Las bibliotecas
+pesadas (matplotlib, seaborn, scikit-learn) y las cachés compartidas se precargan
+en un hilo en segundo plano una vez servida la primera página (``CFC_PRECARGA=0``
+lo desactiva).
+"""
+import importlib
+import logging
+import os
+import sys
+import threading
+
+import streamlit as st
+
+from instrumentacion import tramo
+
+PAGINAS = {
+    "Presentación y Datos": "paginas.presentacion",
+    "Modelo Predictivo": "paginas.modelo",
+    "Conclusiones y Perfil": "paginas.conclusiones",
+}
+
+PRECARGA = os.environ.get("CFC_PRECARGA", "1").lower() not in ("0", "false", "no")
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_log = logging.getLogger(__name__)
+
+
+def mostrar(nombre, archivo_datos):
+    """Importa (la primera vez) el módulo de la página ``nombre`` y la dibuja con esa cartera."""
+    with tramo(f"importar:{PAGINAS[nombre]}"):
+        modulo = importlib.import_module(PAGINAS[nombre])
+    modulo.mostrar(archivo_datos)
+
+
+def elegir_portafolio():
+    """Selector de cartera en la barra lateral (solo si hay más de una); devuelve su archivo de datos."""
+    import datos
+    import portafolios
+
+    carteras = portafolios.portafolios()
+    nombre = portafolios.GENERAL
+    if len(carteras) > 1:
+        nombre = st.sidebar.selectbox("Cartera", list(carteras), key="portafolio")
+        en_uso = sum(datos.memoria_en_uso().values()) / 2 ** 20
+        st.sidebar.caption(f"Datos en memoria: {en_uso:,.0f} de {datos.PRESUPUESTO_MEMORIA_MB:,.0f} MB")
+    return carteras.get(nombre, carteras[portafolios.GENERAL])
+
+
+def mostrar_imagen(ruta, ancho=None):
+    """Muestra una imagen estática ya reducida y codificada (ver ``recursos``), por defecto a su ancho de ``IMAGENES``."""
+    import recursos
+
+    ancho = ancho or recursos.IMAGENES[os.path.basename(ruta)]
+    # Bytes al ancho exacto: Streamlit los registra sin recodificar y el rerun solo envía su URL /media
+    st.image(recursos.obtener(ruta, ancho).datos, width=ancho)
+
+
+def mostrar_figura(nombre, version, dibujar):
+    """Muestra una figura desde la caché de PNG (solo se dibuja si no está cacheada)."""
+    from graficos import figura_png
+
+    with tramo(f"figura:{nombre}"):
+        st.image(figura_png(nombre, version, dibujar))
+
+
+# 🔥 Precarga en segundo plano, una vez por proceso
+_precarga = None
+_bloqueo = threading.Lock()
+
+
+def _precargar():
+    pasos = [
+        ("bibliotecas", lambda: [importlib.import_module(m) for m in ("matplotlib.figure", "seaborn", "sklearn")]),
+        ("páginas", lambda: [importlib.import_module(m) for m in PAGINAS.values()]),
+        ("imágenes", lambda: importlib.import_module("recursos").preparar_todas(RAIZ)),
+        ("datos", _precargar_datos),
+        ("modelo", lambda: importlib.import_module("pipeline").obtener_pipeline()),
+    ]
+    for nombre, paso in pasos:
+        try:
+            paso()
+        except Exception:  # la precarga nunca debe tumbar el proceso: la página lo cargará al pedirlo
+            _log.warning("Precarga de %s fallida", nombre, exc_info=True)
+
+
+def _precargar_datos():
+    from agregados import obtener_agregados
+    from datos import obtener_datos
+
+    obtener_agregados(obtener_datos())
+
+
+def precalentar():
+    """Lanza la precarga en un hilo daemon si aún no se ha hecho en este proceso; devuelve el hilo."""
+    global _precarga
+    if not PRECARGA:
+        return None
+    with _bloqueo:
+        if _precarga is None:
+            # Streamlit añade la carpeta de la app a sys.path solo mientras ejecuta el script
+            # (y al terminar quita la primera aparición): el hilo necesita una copia propia
+            sys.path.append(RAIZ)
+            _precarga = threading.Thread(target=_precargar, name="cfc-precarga", daemon=True)
+            _precarga.start()
+        return _precarga
@@ -0,0 +1,139 @@
+"""💼 Página "Conclusiones y Perfil": contenido fijo, sin dataset ni modelo."""
+import pandas as pd
+import streamlit as st
+
+import graficos
+from paginas import mostrar_figura, mostrar_imagen
+
+
+def mostrar(archivo=None):
+    st.title("Data Science y Business Intelligence: Estrategia para Empresas")
+
+    st.subheader("Cómo los Datos Transforman la Industria")
+    st.write("""
+    En un mundo impulsado por la información, **Data Science y Business Intelligence** son clave para la toma de decisiones estratégicas.  
+    La capacidad de analizar datos permite **reducir costos, mejorar procesos y maximizar rentabilidad**, convirtiendo información en  
+    ventajas competitivas reales.  
+    """)
+
+    # 📊 **Impacto del Data Science en las Empresas**
+    st.subheader("¿Por qué Data Science es clave en la industria?")
+    impacto_data = pd.DataFrame({
+        "Ámbito": ["Optimización de costos", "Predicción de tendencias", "Reducción de riesgos",
+                   "Automatización de procesos", "Mejor toma de decisiones", "Eficiencia operativa"],
+        "Impacto (%)": [30, 25, 20, 15, 35, 10]
+    })
+
+    mostrar_figura("impacto_data_science", graficos.version_de(impacto_data), lambda: graficos.barras_horizontales(
+        impacto_data, x="Impacto (%)", y="Ámbito", palette="Blues",
+        titulo="Impacto del Data Science en la Empresa", xlabel="Nivel de Impacto (%)"))
+
+    st.write("""
+    📌 **Conclusiones estratégicas:**  
+    ✔ **Optimización de costos** permite mayor margen operativo.  
+    ✔ **Automatización de procesos** reduce tiempos de ejecución y errores.  
+    ✔ **Predicción de tendencias** mejora la adaptabilidad en mercados volátiles.  
+    """)
+
+    # 💼 **Perfil Profesional**
+    st.subheader("Cristina Puertas Camarero")
+
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        mostrar_imagen("cris.jpg")
+
+    with col2:
+        st.write("""
+        **Data Analyst | Data Scientist | Business Intelligence**  
+        Especialista en análisis de datos con orientación estratégica, enfocada en **optimización empresarial, modelos predictivos y rentabilidad**.  
+        Mi trayectoria combina **Data Science, Business Intelligence y estrategia comercial**, logrando impacto directo en **decisiones financieras y operativas**.  
+        """)
+
+    # 📌 **Enlaces a perfiles profesionales**
+    st.markdown("""
+    🔗 **LinkedIn:** [Cristina Puertas Camarero](https://www.linkedin.com/in/cristina-puertas-camarero-8955a6349/)  
+    🔗 **GitHub:** [Cristina-Puertas-Camarero](https://github.com/Cristina-Puertas-Camarero)  
+    📧 **Email:** cris.puertascamarero@gmail.com  
+    📍 **Ubicación:** El Puerto de Santa María, Cádiz, España  
+    📱 **Teléfono:** [+34] 622 504 007  
+    """)
+
+    # 📌 **Habilidades técnicas y blandas visualizadas**
+    st.subheader("Habilidades Técnicas y Estratégicas")
+
+    habilidades_df = pd.DataFrame({
+        "Habilidad": ["Python (Pandas, NumPy, Matplotlib)", "SQL", "Machine Learning", 
+                      "Business Intelligence", "Visualización de Datos (Power BI, Tableau, Streamlit)", 
+                      "Análisis Financiero y Rentabilidad", "Modelos Predictivos", "Optimización de Procesos", 
+                      "Estrategia Comercial", "Automatización en Microsoft Power Platform", 
+                      "Trabajo bajo presión", "Cumplimiento de tiempos de entrega", 
+                      "Orientación al cliente y análisis comercial", "Adaptabilidad a cambios", "Resolución de problemas"],
+        "Nivel (1-10)": [9, 8, 9, 10, 9, 9, 10, 9, 10, 9, 10, 9, 9, 9, 8]
+    })
+
+    mostrar_figura("mapa_habilidades", graficos.version_de(habilidades_df), lambda: graficos.barras_horizontales(
+        habilidades_df, x="Nivel (1-10)", y="Habilidad", palette="coolwarm",
+        titulo="Mapa de Habilidades en Data Science y Estrategia", xlabel="Nivel de Dominio (1-10)"))
+
+    st.write("""
+    📌 **Puntos clave:**  
+    ✔ **Equilibrio entre habilidades técnicas y estratégicas**, permitiendo tomar decisiones con impacto.  
+    ✔ **Trabajo bajo presión y cumplimiento de tiempos**, fundamental en proyectos exigentes.  
+    ✔ **Orientación al cliente y comercial**, asegurando alineación con objetivos empresariales.  
+    """)
+
+    # 📌 **Experiencia Profesional**
+    st.subheader("Experiencia en Datos y Estrategia Empresarial")
+
+    st.write("""
+    He trabajado en **entornos empresariales exigentes**, incluyendo el **sector de construcción y planificación de proyectos en Granada**.  
+    Durante mi trayectoria, he desarrollado **estrategias basadas en datos para optimizar procesos, reducir costos y mejorar márgenes operativos**.  
+    """)
+
+    # 📌 **Proyectos destacados**
+    st.subheader("Aplicaciones Reales: Data Science con Propósito")
+    proyectos_df = pd.DataFrame({
+        "Proyecto": ["A/B Testing - Vanguard", "Trigger Key Words - Suicide Prevention", "Diagnóstico de Cáncer de Mama"],
+        "Tecnología Aplicada": ["Pruebas de hipótesis y análisis de datos", "NLP y modelos predictivos", "Machine Learning en clasificación de tumores"],
+        "Impacto": ["Mejora en experiencia de usuario", "Prevención temprana de riesgos", "Optimización en diagnóstico médico"]
+    })
+    st.table(proyectos_df)
+
+    # 📌 **Educación con logos**
+    st.subheader("Formación Académica")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        mostrar_imagen("ironhack.jpg")
+        st.write("""
+        📌 **Bootcamp en Data Science & Analytics**  
+        Ironhack (Feb 2025 - Abr 2025)  
+        """)
+    
+    with col2:
+        mostrar_imagen("uned.jpg")
+        st.write("""
+        📌 **Máster en Business Intelligence y Power BI**  
+        UNED (Ene 2025 - Jul 2025)  
+        """)
+
+    # 📌 **Cierre persuasivo**
+    st.subheader("📢 ¿Por qué Data Science es clave?")
+    st.write("""
+    En la actualidad, **Data Science define las estrategias empresariales exitosas**.  
+    Mi combinación de **análisis de datos, visión estratégica y optimización comercial** me permite contribuir al crecimiento de cualquier empresa.  
+
+    ✔ **Transformación de procesos mediante datos reales y accionables.**  
+    ✔ **Optimización de márgenes financieros y reducción de costos.**  
+    ✔ **Modelos predictivos que anticipan tendencias y riesgos empresariales.**  
+
+    📌 ¿Por qué Construcciones Felipe Castellano?
+
+    Construcciones Felipe Castellano representa el compromiso con la innovación en construcción y la integración de soluciones estratégicas basadas en datos. Su enfoque en optimización de proyectos, eficiencia operativa y calidad estructural es exactamente el tipo de entorno donde mi perfil en Data Science y Business Intelligence puede generar un impacto tangible.
+    Lo que más me motiva de la empresa es su visión orientada a la mejora continua, el uso de datos para anticipar desafíos en planificación y su apuesta por maximizar la rentabilidad sin comprometer calidad. Mi experiencia en análisis financiero, modelos predictivos y optimización de procesos puede contribuir a fortalecer la gestión de costos y tiempos de entrega, asegurando una ejecución más eficiente de los proyectos
+    Trabajar en un sector exigente como la construcción y aplicar técnicas de Data Science es un reto apasionante, donde cada decisión basada en datos puede significar una mejor planificación, menor riesgo y mayor competitividad. Estoy convencida de que puedo aportar valor real en este contexto y ayudar a transformar la industria con información estratégica.
+
+    📌 **. Estoy lista para nuevos desafíos. Muchas gracias por esta oportunidad de presentación de mi perfil**  
+    """)
@@ -0,0 +1,241 @@
+"""🔍 Página "Modelo Predictivo": predicción, mapa de riesgo, simulación y carteras."""
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import graficos
+from agregados import obtener_agregados
+from datos import obtener_datos
+from escenarios import obtener_superficie
+from instrumentacion import tramo
+from lotes import TAM_BLOQUE, puntuar_archivo
+from montecarlo import ESCENARIOS, Incertidumbre, probabilidades_clima, sigma_residual, simular
+from paginas import mostrar_figura
+from pipeline import CategoriaDesconocida, obtener_pipeline
+from prediccion import UMBRAL_RIESGO_BAJO, UMBRAL_RIESGO_MODERADO, nivel_riesgo
+
+
+# 📦 Tamaño máximo de los resultados de cartera que se ofrecen para descargar
+LIMITE_DESCARGA_MB = float(os.environ.get("CFC_LIMITE_DESCARGA_MB", 200))
+
+# 📌 Análisis de resultados según la banda de riesgo
+RECOMENDACIONES = {
+    "Riesgo Bajo": """
+    ✔ El proyecto tiene **bajas probabilidades** de retraso según los parámetros ingresados.  
+    ✔ Se recomienda seguir con la planificación actual para mantener el rendimiento.  
+    """,
+    "Riesgo Moderado": """
+    ⚠️ Existe un **riesgo moderado** de retraso en la obra.  
+    ✔ Se sugiere **optimizar tiempos** y revisar el impacto del clima y los materiales en la ejecución.  
+    """,
+    "Riesgo Alto": """
+    ❌ **Riesgo alto de retraso** identificado.  
+    ✔ Se recomienda **revisión completa de la planificación**, ajustes en materiales y tiempos de entrega.  
+    ✔ Evaluar estrategias para reducir el impacto en costos y cumplimiento de plazos.  
+    """,
+}
+
+
+def mostrar(archivo):
+    st.title("Predicción de Riesgo de Retraso en Construcción")
+
+    st.write("""
+    La planificación eficiente de proyectos de construcción es clave para evitar sobrecostos y retrasos.  
+    Este modelo de **regresión lineal** estima el **riesgo de retraso (%)** a partir de factores como duración de obra, materiales y clima.  
+    Con estos análisis, se pueden tomar **decisiones estratégicas** para optimizar tiempos y costos.
+    """)
+
+    # 📂 Obtener el artefacto de predicción (codificadores + modelo) desde el registro
+    try:
+        with tramo("pipeline"):
+            pipeline, version_modelo = obtener_pipeline()
+    except FileNotFoundError as e:
+        st.error(f"Error: No se encontró el archivo '{e.filename}'.")
+        return
+    st.caption(f"Modelo {version_modelo}")
+
+    # 📂 Cargar el dataset para obtener los rangos de las variables
+    try:
+        with tramo("datos"):
+            conjunto = obtener_datos(archivo)
+    except FileNotFoundError:
+        st.error(f"Error: No se encontró el archivo '{archivo}'.")
+        return
+    with tramo("agregados"):
+        agregados = obtener_agregados(conjunto)
+    duracion_min, duracion_max = agregados.extremos("Duración (meses)")
+    costo_min, costo_max = agregados.extremos("Costo Total (€)")
+
+    # 📥 Entrada de datos para prueba del modelo
+    st.subheader("Parámetros del Proyecto")
+
+    tipo_construccion = st.selectbox("Tipo de Construcción", pipeline.clases("Tipo de Construcción"))
+    duracion = st.slider("Duración de la obra (meses)", int(duracion_min), int(duracion_max), 18)
+    costo = st.number_input("Costo Total (€)", int(costo_min), int(costo_max), 1500000)
+    material = st.selectbox("Material Principal", pipeline.clases("Material Principal"))
+    clima = st.selectbox("Clima Predominante", pipeline.clases("Clima Predominante"))
+
+    # 🔄 Convertir entrada a valores numéricos (búsqueda en los vocabularios del artefacto)
+    proyecto = {
+        "Tipo de Construcción": tipo_construccion,
+        "Duración (meses)": duracion,
+        "Costo Total (€)": costo,
+        "Material Principal": material,
+        "Clima Predominante": clima,
+    }
+    try:
+        input_data = pipeline.codificar_fila(**proyecto)
+    except CategoriaDesconocida as e:
+        st.error(f"Error al transformar los datos categóricos: {e}. Vuelve a generar el artefacto con `python entrenar.py`.")
+        return
+
+    # 🧭 Superficie de riesgo precalculada: estimación puntual y análisis what-if
+    with tramo("superficie"):
+        superficie = obtener_superficie(pipeline, version_modelo, agregados)
+
+    # 🔍 Generación de la predicción (con el modelo lineal, consulta exacta a la superficie)
+    try:
+        with tramo("prediccion"):
+            if pipeline.motor is not None:
+                prediccion = superficie.consultar(tipo_construccion, material, clima, duracion, costo)
+            else:
+                prediccion = pipeline.predecir(input_data)[0]
+        st.subheader("Estimación del Riesgo de Retraso")
+
+        # 📊 Banda y color del nivel de riesgo (umbrales de prediccion.py)
+        nivel, color = nivel_riesgo(prediccion)
+
+        # 🔎 Mostrar el resultado visualmente
+        st.markdown(f"""
+        <div style="text-align: center; font-size: 22px; color: {color};">
+            **{nivel}**
+            <h1 style="color: {color};">{prediccion:.2f}%</h1>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # 📌 Análisis de resultados
+        st.write(RECOMENDACIONES[nivel])
+
+    except Exception as e:
+        st.error(f"Error al generar la predicción: {e}")
+
+    st.write("""
+    La predicción del **riesgo de retraso** permite ajustar planificación, prever costos y minimizar riesgos operativos.  
+    Este análisis es una herramienta clave para asegurar la eficiencia y éxito en cada proyecto de construcción.
+    """)
+
+    # 🧭 Análisis what-if sobre la superficie de riesgo precalculada
+    st.subheader("Mapa de Riesgo: ¿Qué pasaría si...?")
+    st.write("""
+    El modelo se evalúa una sola vez sobre **todas las combinaciones** de tipo, material, clima, duración y coste.  
+    Las líneas negras marcan dónde el riesgo cruza el **10 %** y el **20 %**; al mover los controles solo se consulta la superficie.  
+    """)
+
+    mostrar_figura(f"superficie_riesgo:{tipo_construccion}|{material}|{clima}", superficie.version,
+                   lambda: graficos.superficie_riesgo(superficie, tipo_construccion, material, clima))
+
+    # 📌 Fronteras de las bandas de riesgo para el coste seleccionado
+    fronteras = superficie.fronteras(tipo_construccion, material, clima, costo)
+    desde_moderado, desde_alto = fronteras[UMBRAL_RIESGO_BAJO], fronteras[UMBRAL_RIESGO_MODERADO]
+    bandas = []
+    if desde_moderado is None:
+        bandas.append("**bajo** en todo el rango de duraciones")
+    else:
+        if desde_moderado > superficie.duraciones[0]:
+            bandas.append(f"**bajo** hasta {desde_moderado - 1} meses")
+        if desde_alto is None:
+            bandas.append(f"**moderado** a partir de {desde_moderado} meses")
+        else:
+            if desde_alto > desde_moderado:
+                bandas.append(f"**moderado** de {desde_moderado} a {desde_alto - 1} meses")
+            bandas.append(f"**alto** desde {desde_alto} meses")
+    st.write(f"📌 Con un coste de **{costo:,.0f} €**, riesgo " + ", ".join(bandas) + ".")
+
+    st.write("**Riesgo estimado (%) de todas las combinaciones para la duración y el coste seleccionados:**")
+    tabla_combinaciones = superficie.combinaciones(duracion, costo).unstack(["Material Principal", "Clima Predominante"])
+    st.dataframe(tabla_combinaciones.style.format("{:.1f}").background_gradient(
+        cmap="RdYlGn_r", vmin=0, vmax=graficos.ESCALA_RIESGO_MAX, axis=None))
+
+    # 🎲 Simulación Monte Carlo: distribución del riesgo en lugar de una única estimación
+    st.subheader("Simulación Monte Carlo del Riesgo")
+    st.write("""
+    La duración, el coste y el clima reales rara vez coinciden con lo planificado. La simulación propaga esa **incertidumbre**  
+    (y el error propio del modelo) a través de cientos de miles de escenarios y estima la **probabilidad de cada nivel de riesgo**.  
+    """)
+
+    col1, col2 = st.columns(2)
+    desviacion_duracion = col1.slider("Incertidumbre en la duración (± meses)", 0.0, 6.0, 2.0, step=0.5)
+    sobrecoste = col2.slider("Rango de sobrecoste (%)", -10, 50, (0, 20))
+    clima_incierto = col1.checkbox("Clima incierto (frecuencias históricas)")
+    escenarios = col2.select_slider("Escenarios", [10_000, 50_000, 100_000, 200_000, 500_000], value=ESCENARIOS)
+
+    probabilidades = None
+    if clima_incierto:
+        probabilidades = probabilidades_clima(pipeline, agregados.conteos("Clima Predominante"))
+        if probabilidades is None:
+            st.warning("Ningún clima de esta cartera está en los datos de entrenamiento: se mantiene el clima elegido.")
+    incertidumbre = Incertidumbre(
+        desviacion_duracion=desviacion_duracion,
+        sobrecoste=(sobrecoste[0] / 100, sobrecoste[1] / 100),
+        probabilidades_clima=probabilidades,
+        sigma_residual=sigma_residual(pipeline, version_modelo, conjunto),
+    )
+    with tramo("montecarlo"):
+        simulacion = simular(pipeline, proyecto, incertidumbre, escenarios, conservar_muestras=True)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Percentil 5", f"{simulacion.percentiles[5]:.2f}%")
+    col2.metric("Mediana", f"{simulacion.percentiles[50]:.2f}%")
+    col3.metric("Percentil 95", f"{simulacion.percentiles[95]:.2f}%")
+    for columna, (nivel, probabilidad) in zip(st.columns(3), simulacion.probabilidades.items()):
+        columna.metric(f"Probabilidad de {nivel}", f"{probabilidad:.1%}")
+
+    conteos, bordes = np.histogram(simulacion.muestras, bins=60)
+    st.bar_chart(pd.Series(conteos, index=np.round((bordes[:-1] + bordes[1:]) / 2, 2), name="Escenarios"))
+    st.caption(f"{simulacion.escenarios:,} escenarios simulados en {simulacion.segundos * 1000:,.0f} ms "
+               f"(error residual del modelo: σ = {incertidumbre.sigma_residual:.2f} puntos)")
+
+    # 📦 Evaluación masiva de una cartera de proyectos
+    st.subheader("Evaluación Masiva de Cartera")
+    st.write(f"""
+    Sube una cartera con las columnas **Tipo de Construcción, Duración (meses), Costo Total (€), Material Principal y Clima Predominante**.  
+    El archivo se procesa por bloques, por lo que el consumo de memoria no depende del número de proyectos.  
+    Los resultados se descargan en Parquet comprimido hasta {LIMITE_DESCARGA_MB:,.0f} MB; para carteras mayores, `python lotes.py`.  
+    """)
+
+    archivo_cartera = st.file_uploader("Cartera de proyectos (CSV, Excel o Parquet)",
+                                       type=["csv", "parquet", "xlsx", "xls", "xlsm", "ods"])
+    tam_bloque = st.number_input("Filas por bloque", min_value=1_000, max_value=1_000_000, value=TAM_BLOQUE, step=10_000)
+
+    if archivo_cartera is not None and st.button("Evaluar cartera"):
+        progreso = st.empty()
+        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as temporal:
+            destino = temporal.name
+        try:
+            with tramo("lote"):
+                resumen = puntuar_archivo(
+                    archivo_cartera, destino, pipeline, int(tam_bloque),
+                    nombre=archivo_cartera.name,
+                    al_avanzar=lambda r: progreso.write(f"⏳ {r.filas:,} proyectos evaluados ({r.filas_por_segundo:,.0f} filas/s)"),
+                )
+            progreso.empty()
+            st.success(f"✅ {resumen.filas:,} proyectos evaluados en {resumen.segundos:.2f} s "
+                       f"({resumen.filas_por_segundo:,.0f} filas/s)")
+            st.table(pd.Series(resumen.niveles, name="Proyectos").sort_index())
+            # Streamlit guarda en memoria lo que se ofrece para descargar: por encima del límite no se ofrece
+            tamano_mb = os.path.getsize(destino) / 2 ** 20
+            if tamano_mb > LIMITE_DESCARGA_MB:
+                st.warning(f"Los resultados ocupan {tamano_mb:,.0f} MB, por encima del límite de descarga "
+                           f"({LIMITE_DESCARGA_MB:,.0f} MB, `CFC_LIMITE_DESCARGA_MB`). Usa "
+                           f"`python lotes.py {archivo_cartera.name} resultados.parquet`.")
+            else:
+                with open(destino, "rb") as resultados:
+                    st.download_button("Descargar resultados (Parquet)", resultados, file_name="riesgo_cartera.parquet",
+                                       mime="application/vnd.apache.parquet")
+        except (ValueError, KeyError) as e:
+            st.error(f"Error al evaluar la cartera: {e}")
+        finally:
+            os.remove(destino)
@@ -0,0 +1,166 @@
+"""📊 Página "Presentación y Datos": KPIs y figuras del dataset."""
+import streamlit as st
+
+import graficos
+from agregados import KPIS, obtener_agregados, tabla_competencia
+from datos import obtener_datos
+from instrumentacion import tramo
+from paginas import mostrar_figura
+
+
+def mostrar(archivo):
+    st.title("Innovación en Construcción a través del Análisis de Datos")
+
+    st.write("""
+    La industria de la construcción enfrenta desafíos constantes relacionados con **costos, eficiencia y planificación**.  
+    En este contexto, el análisis de datos permite una **toma de decisiones basada en información estratégica**, anticipando riesgos  
+    y optimizando recursos para mejorar la rentabilidad y reducir incertidumbre.
+    """)
+
+    # 📌 Cargar datos desde la caché columnar compartida
+    with tramo("datos"):
+        conjunto = obtener_datos(archivo)
+    df, version_datos = conjunto.df, conjunto.version
+    with tramo("agregados"):
+        agregados = obtener_agregados(conjunto)  # KPIs precalculados por versión del dataset
+
+
+    # 📊 KPIs clave en construcción
+    st.subheader("Indicadores Estratégicos de Construcción")
+
+    for columna, (etiqueta, metrica, formato) in zip(st.columns(len(KPIS)), KPIS):
+        columna.metric(label=etiqueta, value=formato.format(agregados.media(metrica)))
+
+    st.write("""
+    **Interpretación:**  
+    - **Costo Promedio:** El gasto medio por proyecto es considerable, lo que subraya la importancia de una buena gestión financiera.  
+    - **Duración Promedio:** Un análisis detallado del tiempo invertido permite **ajustes en planificación** y reducción de imprevistos.  
+    - **Eficiencia Promedio:** La eficiencia global en los proyectos es **clave** para maximizar los recursos y mejorar la rentabilidad.  
+    """)
+
+    # 📊 Distribución de costos en construcción
+    st.subheader("Distribución de Costos en Construcción")
+    mostrar_figura("distribucion_costos", version_datos, lambda: graficos.distribucion_costos(df))
+
+    st.write("""
+    📌 **Hallazgos clave:**  
+    - Se observa una gran variabilidad en los costos, indicando diferencias **según el tipo de obra y materiales empleados**.  
+    - La presencia de algunos proyectos con costos muy altos sugiere la necesidad de una **gestión de riesgo ajustada**.  
+    """)
+
+    # 📌 Relación entre duración y costos
+    st.subheader("Impacto de la Duración en Costos Totales")
+    mostrar_figura("duracion_vs_costo", version_datos, lambda: graficos.duracion_vs_costo(df))
+
+    st.write("""
+    📌 **Hallazgos clave:**  
+    - Se confirma una **correlación positiva** entre la duración y el costo de los proyectos.  
+    - La planificación del tiempo es **crítica** para evitar escaladas innecesarias en los costos finales.  
+    """)
+
+    # 📌 Comparación de eficiencia según material principal
+    st.subheader("Eficiencia en Construcción según Materiales Utilizados")
+    mostrar_figura("eficiencia_por_material", version_datos,
+                   lambda: graficos.eficiencia_por_material(df, agregados))
+
+    st.write("""
+    📌 **Hallazgos clave:**  
+    - Se observan variaciones significativas en la eficiencia según el material empleado.  
+    - Materiales como **hormigón y acero** ofrecen **mayor estabilidad y rendimiento**, mientras que opciones más económicas  
+      pueden comprometer la calidad estructural.  
+    """)
+
+    st.write("""
+    Este análisis confirma la importancia de una **gestión precisa de costos y materiales**, reforzando la necesidad de modelos predictivos  
+    para evaluar riesgos y mejorar la ejecución de los proyectos.  
+    """)
+# 📌 Evaluación de satisfacción del cliente
+    st.subheader("Evaluación de Satisfacción en los Proyectos")
+    mostrar_figura("satisfaccion_por_tipo", version_datos,
+                   lambda: graficos.satisfaccion_por_tipo(df, agregados))
+
+    st.write("""
+    📌 **Hallazgos clave:**  
+    - Las construcciones **residenciales** tienden a recibir calificaciones más altas en satisfacción.  
+    - La satisfacción del cliente es un **indicador clave** para evaluar la calidad del proyecto.  
+    """)
+
+    st.write("""
+    Este análisis confirma la importancia de una **gestión precisa de costos, materiales y percepción del cliente**, reforzando la necesidad  
+    de modelos predictivos para evaluar riesgos y mejorar la ejecución de los proyectos.  
+    """)
+    ### 📌 **Análisis de rentabilidad por tipo de construcción**
+    st.subheader("Rentabilidad Comparativa en Construcción")
+
+    st.write("""
+    Este análisis identifica cuáles son las **construcciones más rentables** al comparar el costo total vs. el margen de eficiencia.  
+    """)
+
+    # 🔹 Rentabilidad media por tipo (la figura se calcula una vez por versión del dataset)
+    mostrar_figura("rentabilidad_por_tipo", version_datos, lambda: graficos.rentabilidad_por_tipo(
+        agregados.medias("Rentabilidad (%)", "Tipo de Construcción")))
+
+    st.write("""
+    📌 **Hallazgos clave:**  
+    - Los proyectos de **infraestructura y comerciales** muestran rentabilidades más bajas debido a costos elevados.  
+    - Las construcciones **residenciales** y **industriales** tienen mejores márgenes de rentabilidad.  
+    - Un departamento de **Data Science** puede optimizar estrategias de inversión y retorno.  
+    """)
+
+
+
+    ### 📌 **Impacto del clima y ubicación en la eficiencia**
+    st.subheader("Cómo el Clima y la Ubicación Afectan la Construcción")
+
+    st.write("""
+    Las condiciones climáticas y la ubicación de un proyecto pueden influir significativamente en la **durabilidad, costos y eficiencia**.  
+    """)
+
+    # 🔹 Análisis del impacto del clima en eficiencia
+    mostrar_figura("eficiencia_por_clima", version_datos,
+                   lambda: graficos.eficiencia_por_clima(df, agregados))
+
+    st.write("""
+    📌 **Hallazgos clave:**  
+    - Las construcciones en **zonas húmedas** tienden a tener menor eficiencia debido a complicaciones estructurales.  
+    - Proyectos en **zonas áridas** tienen mayores rendimientos, pero requieren inversiones adicionales en materiales resistentes.  
+    - Un equipo de **análisis de datos** puede prever el impacto ambiental y optimizar costos según la ubicación del proyecto.  
+    """)
+
+
+
+    ### 📌 **Benchmarking y comparación con otras empresas**
+    st.subheader("Comparación de Desempeño con Empresas del Sector")
+
+    st.write("""
+    El benchmarking permite evaluar el desempeño de los proyectos en comparación con **empresas del mismo sector**,  
+    identificando oportunidades de mejora y eficiencia en la construcción.  
+    """)
+
+    # 🔹 Datos comparativos ficticios (la misma tabla que los informes estáticos)
+    st.table(tabla_competencia(agregados))
+
+    st.write("""
+    📌 **Hallazgos clave:**  
+    - Nuestra empresa tiene una eficiencia **ligeramente superior** a la competencia, pero costos elevados.  
+    - La satisfacción del cliente es **competitiva**, pero aún hay margen para mejorar.  
+    - Un departamento de **Data Science** permitiría analizar a fondo cada métrica y mejorar la ventaja competitiva.  
+    """)
+
+
+
+    ### **Conclusión: ¿Por qué implementar Data Science?**
+    st.subheader("¿Cómo un Departamento de Datos puede Transformar la Construcción?")
+
+    st.write("""
+    El análisis de datos no es solo un complemento: **es un diferenciador competitivo clave** en la industria de la construcción.  
+    Los hallazgos anteriores demuestran que aplicar modelos predictivos y benchmarking en la gestión de proyectos permite:  
+
+    ✔ **Predecir satisfacción del cliente** antes de entregar un proyecto, evitando errores.  
+    ✔ **Mejorar rentabilidad** al elegir los tipos de construcción más eficientes.  
+    ✔ **Optimizar costos** anticipando el impacto del clima y la ubicación en la obra.  
+    ✔ **Comparar el rendimiento con empresas del sector**, detectando oportunidades de mejora.  
+
+    📌 **Invertir en un equipo de Data Science no es un gasto, sino una inversión en competitividad y eficiencia.**  
+    Los datos permiten tomar decisiones informadas, reducir riesgos y aumentar la rentabilidad de cada proyecto.
+    """)
@@ -0,0 +1,209 @@
+"""
+🧩 Artefacto de predicción: codificadores + orden de columnas + valores por defecto + regresor.
+
+``PipelinePrediccion`` se construye una única vez con ``entrenar.py`` y se guarda con
+joblib en ``pipeline_cfc.joblib``. En tiempo de petición la codificación de las
+variables categóricas es una búsqueda en un diccionario (una fila) o en un
+``pd.Categorical`` (lotes), sin volver a ajustar ningún ``LabelEncoder``.
+
+El código de cada categoría es su posición en ``vocabularios[columna]``; con
+vocabularios ordenados alfabéticamente coincide con el de ``LabelEncoder``.
+"""
+import os
+import threading
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from datos import ARCHIVO_DATOS, obtener_datos
+from instrumentacion import tramo
+from modelos import ARCHIVO_MODELO, obtener_modelo
+from motor import MotorLineal
+from prediccion import COLUMNAS_CATEGORICAS, COLUMNAS_MODELO, VALORES_POR_DEFECTO
+
+ARCHIVO_PIPELINE = "pipeline_cfc.joblib"
+
+COLUMNAS_CODIFICADAS = list(COLUMNAS_CATEGORICAS)
+# "Proyecto" se codifica en el notebook, pero es un identificador único por fila: no se
+# guarda su vocabulario y siempre recibe el valor por defecto, al entrenar y al predecir.
+COLUMNAS_IDENTIFICADORAS = ["Proyecto"]
+
+
+class CategoriaDesconocida(ValueError):
+    """Se ha recibido una categoría que no estaba en los datos de entrenamiento."""
+
+    def __init__(self, columna, valores):
+        self.columna = columna
+        self.valores = list(valores)
+        muestra = ", ".join(repr(v) for v in self.valores[:5])
+        super().__init__(f"Valor no reconocido en '{columna}': {muestra}")
+
+    def __reduce__(self):
+        # Se reconstruye con sus propios argumentos al volver de un proceso del pool
+        return type(self), (self.columna, self.valores)
+
+
+def vocabularios_desde_datos(df, columnas=COLUMNAS_CODIFICADAS):
+    """Clases ordenadas de cada columna categórica (equivalente a ``LabelEncoder.classes_``)."""
+    return {col: sorted(df[col].dropna().unique().tolist()) for col in columnas if col in df}
+
+
+@dataclass
+class PipelinePrediccion:
+    modelo: object
+    vocabularios: dict
+    columnas: list = field(default_factory=lambda: list(COLUMNAS_MODELO))
+    valores_por_defecto: dict = field(default_factory=lambda: dict(VALORES_POR_DEFECTO))
+    metadatos: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        for col in COLUMNAS_IDENTIFICADORAS:  # artefactos antiguos guardaban su vocabulario
+            self.vocabularios.pop(col, None)
+        self._indices = {col: {clase: i for i, clase in enumerate(clases)}
+                         for col, clases in self.vocabularios.items()}
+        self._motor = (None, None)
+
+    def __getstate__(self):
+        estado = dict(self.__dict__)
+        estado.pop("_motor", None)
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self.__post_init__()
+
+    @property
+    def motor(self):
+        """``MotorLineal`` del regresor actual, o ``None`` si el regresor no es lineal."""
+        modelo, motor = self._motor
+        if modelo is not self.modelo:
+            motor = MotorLineal.desde_modelo(self.modelo, self.columnas) if MotorLineal.es_compatible(self.modelo) else None
+            self._motor = (self.modelo, motor)
+        return motor
+
+    def clases(self, columna):
+        return list(self.vocabularios[columna])
+
+    def extender_vocabularios(self, df, columnas=COLUMNAS_CATEGORICAS):
+        """
+        Añade al final de cada vocabulario las categorías nuevas de ``df``.
+
+        Los códigos existentes no cambian, así que el regresor sigue siendo válido.
+        Devuelve ``{columna: [categorías añadidas]}``.
+        """
+        nuevas = {}
+        for col in columnas:
+            if col not in df or col not in self.vocabularios:
+                continue
+            indices = self._indices[col]
+            añadidas = [v for v in pd.unique(df[col].dropna()) if v not in indices]
+            for valor in añadidas:
+                indices[valor] = len(self.vocabularios[col])
+                self.vocabularios[col].append(valor)
+            if añadidas:
+                nuevas[col] = añadidas
+        return nuevas
+
+    def _sin_valor_por_defecto(self, columna):
+        return columna not in self.valores_por_defecto
+
+    def codificar_fila(self, **valores):
+        """Vector de una fila a partir de ``{columna: valor}``; lanza ``CategoriaDesconocida``."""
+        fila = np.empty(len(self.columnas), dtype=float)
+        for j, col in enumerate(self.columnas):
+            valor = valores.get(col)
+            if col in COLUMNAS_IDENTIFICADORAS:
+                fila[j] = self.valores_por_defecto[col]
+            elif col in self._indices:
+                codigo = self._indices[col].get(valor)
+                if codigo is None:
+                    if self._sin_valor_por_defecto(col):
+                        raise CategoriaDesconocida(col, [valor])
+                    codigo = self.valores_por_defecto[col]
+                fila[j] = codigo
+            elif valor is None:
+                fila[j] = self.valores_por_defecto[col]
+            else:
+                fila[j] = float(valor)
+        return fila
+
+    def codificar(self, df, desconocidas="nan"):
+        """
+        Matriz numérica del modelo para un DataFrame de proyectos.
+
+        Las columnas ausentes se rellenan con ``valores_por_defecto``. Para categorías
+        fuera del vocabulario, ``desconocidas="nan"`` deja la fila a ``NaN`` (se marcará
+        sin predicción) y ``desconocidas="error"`` lanza ``CategoriaDesconocida``.
+        """
+        X = np.empty((len(df), len(self.columnas)), dtype=float)
+        for j, col in enumerate(self.columnas):
+            if col not in df or col in COLUMNAS_IDENTIFICADORAS:
+                X[:, j] = self.valores_por_defecto[col]
+            elif col in self.vocabularios:
+                # Se buscan solo los valores distintos del bloque: coste independiente del tamaño del vocabulario
+                locales, unicos = pd.factorize(df[col])
+                indices = self._indices[col]
+                mapa = np.array([indices.get(u, -1) for u in unicos] + [-1], dtype=float)
+                codigos = mapa[locales]
+                faltan = codigos < 0
+                if faltan.any():
+                    if not self._sin_valor_por_defecto(col):
+                        codigos[faltan] = self.valores_por_defecto[col]
+                    elif desconocidas == "error":
+                        raise CategoriaDesconocida(col, pd.unique(df[col].to_numpy()[faltan]))
+                    else:
+                        codigos[faltan] = np.nan
+                X[:, j] = codigos
+            else:
+                X[:, j] = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        return X
+
+    def como_dataframe(self, X):
+        """Matriz codificada con los nombres de columna que espera el regresor."""
+        return pd.DataFrame(np.atleast_2d(X), columns=self.columnas)
+
+    def predecir(self, X):
+        """Predicciones para una matriz ya codificada (producto escalar directo si el modelo es lineal)."""
+        motor = self.motor
+        if motor is not None:
+            return motor.puntuar(np.atleast_2d(X))
+        return self.modelo.predict(self.como_dataframe(X))
+
+    def predecir_fila(self, **valores):
+        fila = self.codificar_fila(**valores)
+        motor = self.motor
+        return motor.puntuar(fila) if motor is not None else float(self.predecir(fila)[0])
+
+
+def construir_desde_modelo(modelo, df, **metadatos):
+    """Empaqueta un regresor ya entrenado con vocabularios obtenidos de ``df``."""
+    return PipelinePrediccion(modelo=modelo, vocabularios=vocabularios_desde_datos(df), metadatos=metadatos)
+
+
+# Pipelines construidos al vuelo cuando aún no existe el artefacto: (huella modelo, versión datos) -> pipeline
+_construidos = {}
+_bloqueo = threading.Lock()
+
+
+def obtener_pipeline(ruta=ARCHIVO_PIPELINE, ruta_modelo=ARCHIVO_MODELO, archivo_datos=ARCHIVO_DATOS):
+    """
+    Devuelve ``(pipeline, version)`` desde el registro de modelos.
+
+    Si todavía no se ha generado ``pipeline_cfc.joblib``, se empaqueta una vez el
+    ``modelo_regresion.pkl`` vigente con los vocabularios del dataset.
+    """
+    if os.path.exists(ruta):
+        cargado = obtener_modelo(ruta)
+        return cargado.objeto, f"v{cargado.version} · {cargado.huella[:8]}"
+
+    modelo = obtener_modelo(ruta_modelo)
+    conjunto = obtener_datos(archivo_datos)
+    clave = (modelo.huella, conjunto.version)
+    with _bloqueo:
+        if clave not in _construidos:
+            _construidos.clear()
+            with tramo("pipeline:construir"):
+                _construidos[clave] = construir_desde_modelo(modelo.objeto, conjunto.df, origen=ruta_modelo)
+        # Los vocabularios salen del dataset: su versión forma parte de la del pipeline
+        return _construidos[clave], f"v{modelo.version} · {modelo.huella[:8]} · datos {conjunto.version[:8]}"
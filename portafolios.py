@@ -0,0 +1,93 @@
+"""
+🗃️ Registro de carteras de proyectos.
+
+Cada cartera es un nombre asociado a un archivo de datos (XLSX, CSV o Parquet).
+El registro vive en ``CFC_PORTAFOLIOS`` (por defecto ``portafolios.json``, un
+objeto ``{"nombre": "ruta"}``); la cartera ``General`` apunta siempre al dataset
+por defecto. Registrar una cartera no la carga: ``datos.obtener_datos`` lo hace al
+elegirla y la expulsa cuando se supera el presupuesto de memoria.
+
+Uso::
+
+    python portafolios.py                         # lista las carteras
+    python portafolios.py Norte datos_norte.xlsx  # registra (o actualiza) una cartera
+"""
+import argparse
+import json
+import os
+import threading
+
+import datos
+
+ARCHIVO_PORTAFOLIOS = os.environ.get("CFC_PORTAFOLIOS", "portafolios.json")
+GENERAL = "General"
+
+# 📌 Registros leídos del disco, recargados cuando cambia el archivo: ruta -> (sello, {nombre: archivo})
+_registros = {}
+_bloqueo = threading.Lock()
+
+
+def _sello(ruta):
+    try:
+        estado = os.stat(ruta)
+    except FileNotFoundError:
+        return None
+    return estado.st_mtime_ns, estado.st_size
+
+
+def _leer(ruta):
+    sello = _sello(ruta)
+    with _bloqueo:
+        vigente = _registros.get(ruta)
+        if vigente is None or vigente[0] != sello:
+            registradas = {}
+            if sello is not None:
+                with open(ruta, encoding="utf-8") as f:
+                    registradas = json.load(f)
+            vigente = _registros[ruta] = (sello, registradas)
+        return dict(vigente[1])
+
+
+def portafolios(ruta=ARCHIVO_PORTAFOLIOS):
+    """``{nombre: archivo de datos}`` de todas las carteras, empezando por ``General``."""
+    return {GENERAL: datos.ARCHIVO_DATOS, **_leer(ruta)}
+
+
+def ruta_datos(nombre=GENERAL, ruta=ARCHIVO_PORTAFOLIOS):
+    """Archivo de datos de la cartera ``nombre``; lanza ``KeyError`` si no está registrada."""
+    return portafolios(ruta)[nombre]
+
+
+def registrar(nombre, archivo, ruta=ARCHIVO_PORTAFOLIOS):
+    """Añade (o actualiza) una cartera en el registro, escrito de forma atómica."""
+    if nombre == GENERAL:
+        raise ValueError(f"'{GENERAL}' está reservada para el dataset por defecto ({datos.ARCHIVO_DATOS}).")
+    if not os.path.exists(archivo):
+        raise FileNotFoundError(2, "No existe el archivo de datos", archivo)
+    registradas = _leer(ruta)
+    registradas[nombre] = archivo
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(registradas, f, ensure_ascii=False, indent=2)
+    os.replace(temporal, ruta)
+    return registradas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Registro de carteras de proyectos.")
+    parser.add_argument("nombre", nargs="?", help="Nombre de la cartera a registrar")
+    parser.add_argument("archivo", nargs="?", help="Archivo de datos de la cartera")
+    parser.add_argument("--registro", default=ARCHIVO_PORTAFOLIOS)
+    args = parser.parse_args(argv)
+
+    if args.nombre:
+        if not args.archivo:
+            parser.error("Falta el archivo de datos de la cartera")
+        registrar(args.nombre, args.archivo, args.registro)
+        print(f"✅ Cartera '{args.nombre}' → '{args.archivo}'")
+    for nombre, archivo in portafolios(args.registro).items():
+        print(f"{nombre:<24} {archivo}")
+
+
+if __name__ == "__main__":
+    main()
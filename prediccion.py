@@ -0,0 +1,39 @@
+"""
+🔍 Utilidades compartidas de predicción del riesgo de retraso.
+
+Reúne el orden de columnas que espera el modelo, los valores de relleno y las
+bandas de riesgo (10 % / 20 %) que usa la aplicación. La codificación de las
+variables categóricas vive en ``pipeline.py``.
+"""
+import numpy as np
+
+COLUMNAS_CATEGORICAS = ["Tipo de Construcción", "Material Principal", "Clima Predominante"]
+
+# 📊 Orden exacto de las columnas según el modelo entrenado
+COLUMNAS_MODELO = ["Proyecto", "Tipo de Construcción", "Duración (meses)", "Costo Total (€)", "Material Principal",
+                   "Clima Predominante", "Eficiencia (%)", "Satisfacción Cliente (1-5)"]
+
+# Valores que la aplicación usa cuando el dato no se pide al usuario
+VALORES_POR_DEFECTO = {"Proyecto": 0, "Eficiencia (%)": 80, "Satisfacción Cliente (1-5)": 4.5}
+
+COLUMNA_PREDICCION = "Riesgo de Retraso Estimado (%)"
+COLUMNA_NIVEL = "Nivel de Riesgo"
+
+UMBRAL_RIESGO_BAJO = 10
+UMBRAL_RIESGO_MODERADO = 20
+NIVELES_RIESGO = np.array(["Riesgo Bajo", "Riesgo Moderado", "Riesgo Alto"])
+COLORES_RIESGO = {"Riesgo Bajo": "green", "Riesgo Moderado": "orange", "Riesgo Alto": "red"}
+NIVEL_DESCONOCIDO = "Sin predicción"
+
+
+def clasificar_riesgo(predicciones):
+    """Asigna a cada predicción su banda de riesgo (vectorizado)."""
+    predicciones = np.asarray(predicciones, dtype=float)
+    niveles = NIVELES_RIESGO[np.digitize(predicciones, [UMBRAL_RIESGO_BAJO, UMBRAL_RIESGO_MODERADO])]
+    return np.where(np.isnan(predicciones), NIVEL_DESCONOCIDO, niveles)
+
+
+def nivel_riesgo(prediccion):
+    """Devuelve ``(nivel, color)`` para una única predicción."""
+    nivel = str(clasificar_riesgo([prediccion])[0])
+    return nivel, COLORES_RIESGO.get(nivel, "gray")
@@ -0,0 +1,114 @@
+"""
+🖼️ Imágenes estáticas de la aplicación (logo, foto de perfil, logos de formación).
+
+``st.image("cris.jpg", width=180)`` lee el archivo original en cada rerun y
+Streamlit lo decodifica, lo reduce y lo vuelve a codificar en JPEG/PNG antes de
+registrarlo en su gestor de medios. Aquí cada imagen se reduce una sola vez al
+ancho exacto con que se muestra y se codifica en el formato que Streamlit
+elegiría (PNG si tiene transparencia, JPEG si no), y los bytes se guardan en una
+caché de proceso con clave la huella SHA-256 del original. Al pasar esos bytes a
+``st.image`` con el mismo ancho, Streamlit los registra tal cual (sin decodificar
+ni recodificar) y el mensaje de cada rerun solo lleva la URL ``/media/...``, que
+depende del contenido y el navegador descarga una vez. Un rerun solo comprueba
+con ``os.stat`` si el archivo ha cambiado.
+"""
+import hashlib
+import io
+import os
+import threading
+from dataclasses import dataclass
+
+CALIDAD = int(os.environ.get("CFC_CALIDAD_IMAGENES", 80))
+
+# Imágenes de la app y ancho (px) con que se muestran
+IMAGENES = {
+    "CFC.png": 200,
+    "cris.jpg": 180,
+    "ironhack.jpg": 180,
+    "uned.jpg": 180,
+}
+
+
+@dataclass(frozen=True)
+class Recurso:
+    datos: bytes
+    mime: str
+    ancho: int
+    alto: int
+    huella: str  # SHA-256 del archivo original
+
+
+def codificar(origen, ancho_px, calidad=CALIDAD):
+    """Reduce la imagen (bytes del original) a ``ancho_px`` y la codifica; devuelve ``(datos, mime, ancho, alto)``."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(origen)) as imagen:
+        # Mismo criterio que st.image: PNG si puede tener transparencia, JPEG si no
+        transparente = imagen.mode in ("RGBA", "LA", "P") or "transparency" in imagen.info
+        imagen = imagen.convert("RGBA" if transparente else "RGB")
+        if imagen.width > ancho_px:
+            imagen = imagen.resize((ancho_px, round(imagen.height * ancho_px / imagen.width)), Image.LANCZOS)
+        if transparente:
+            # Logos: paleta de 256 colores con transparencia (sigue siendo PNG para st.image)
+            imagen = imagen.quantize(256, method=Image.Quantize.FASTOCTREE)
+            formato, opciones = "PNG", {"optimize": True}
+        else:
+            formato, opciones = "JPEG", {"quality": calidad, "optimize": True, "progressive": True}
+        buffer = io.BytesIO()
+        imagen.save(buffer, format=formato, **opciones)
+        return buffer.getvalue(), f"image/{formato.lower()}", imagen.width, imagen.height
+
+
+# 📌 Caché de proceso: ruta -> (sello de fichero, huella) y (huella, ancho px, calidad) -> Recurso
+_huellas = {}
+_recursos = {}
+_bloqueo = threading.Lock()
+
+
+def _sello(ruta):
+    estado = os.stat(ruta)
+    return estado.st_mtime_ns, estado.st_size
+
+
+def obtener(ruta, ancho, calidad=CALIDAD):
+    """
+    ``Recurso`` de ``ruta`` para mostrarla a ``ancho`` px; se prepara una vez por versión del archivo.
+
+    El ancho es exacto: si los bytes fueran más anchos que el ``width`` de
+    ``st.image``, Streamlit volvería a reducirlos en cada rerun.
+    """
+    ruta = os.path.abspath(ruta)
+    sello = _sello(ruta)
+    ancho_px = max(1, int(ancho))
+    with _bloqueo:
+        vigente = _huellas.get(ruta)
+        if vigente is not None and vigente[0] == sello:
+            recurso = _recursos.get((vigente[1], ancho_px, calidad))
+            if recurso is not None:
+                return recurso
+
+    with open(ruta, "rb") as f:
+        origen = f.read()
+    huella = hashlib.sha256(origen).hexdigest()
+    datos, mime, ancho_real, alto = codificar(origen, ancho_px, calidad)
+    recurso = Recurso(datos, mime, ancho_real, alto, huella)
+
+    with _bloqueo:
+        anterior = _huellas.get(ruta)
+        if anterior is not None and anterior[1] != huella:
+            # El archivo cambió: las versiones preparadas del original anterior ya no se sirven
+            for clave in [c for c in _recursos if c[0] == anterior[1]]:
+                del _recursos[clave]
+        _huellas[ruta] = (sello, huella)
+        return _recursos.setdefault((huella, ancho_px, calidad), recurso)
+
+
+def preparar_todas(directorio="."):
+    """Prepara todas las ``IMAGENES`` (precarga); devuelve ``{nombre: Recurso}``."""
+    return {nombre: obtener(os.path.join(directorio, nombre), ancho) for nombre, ancho in IMAGENES.items()}
+
+
+def vaciar_cache():
+    with _bloqueo:
+        _huellas.clear()
+        _recursos.clear()
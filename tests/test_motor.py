@@ -0,0 +1,51 @@
+"""🧪 ``MotorLineal``: una fila, un lote y el ida y vuelta por ``.npz``."""
+import os
+import sys
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor import MotorLineal  # noqa: E402
+
+COLUMNAS = ["a", "b", "c"]
+
+
+@pytest.fixture
+def modelo():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(50, len(COLUMNAS)))
+    y = X @ np.array([1.5, -2.0, 0.5]) + 3.0 + rng.normal(scale=0.1, size=50)
+    return LinearRegression().fit(X, y), X
+
+
+def test_una_fila(modelo):
+    regresor, X = modelo
+    motor = MotorLineal.desde_modelo(regresor, COLUMNAS)
+    prediccion = motor.puntuar(X[0])
+    assert isinstance(prediccion, float)
+    assert prediccion == pytest.approx(regresor.predict(X[:1])[0])
+
+
+def test_lote(modelo):
+    regresor, X = modelo
+    motor = MotorLineal.desde_modelo(regresor, COLUMNAS)
+    predicciones = motor.puntuar(X)
+    assert predicciones.shape == (len(X),)
+    np.testing.assert_allclose(predicciones, regresor.predict(X))
+    with pytest.raises(ValueError):
+        motor.puntuar(X[:, :2])
+
+
+def test_guardar_y_cargar(modelo, tmp_path):
+    regresor, X = modelo
+    motor = MotorLineal.desde_modelo(regresor, COLUMNAS)
+    destino = tmp_path / "motor.npz"
+    motor.guardar(destino)
+    cargado = MotorLineal.cargar(destino)
+    np.testing.assert_array_equal(cargado.coeficientes, motor.coeficientes)
+    assert cargado.intercepto == motor.intercepto
+    assert cargado.columnas == tuple(COLUMNAS)
+    np.testing.assert_allclose(cargado.puntuar(X), motor.puntuar(X))